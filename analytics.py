@@ -0,0 +1,164 @@
+"""Vectorized analytics over the stored move history."""
+
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import and_, case, select
+from sqlalchemy.orm import Session, aliased
+
+from models import Game, GameStatus, Move, Player
+
+CELLS = 9
+MAX_MOVES = 9
+CHUNK_SIZE = 100_000
+
+# Outcome codes used in the loaded arrays (index into the outcome axis).
+IN_PROGRESS, X_WINS, O_WINS, DRAW = range(4)
+
+
+@dataclass(frozen=True, slots=True)
+class MoveStats:
+    """
+    Aggregated move statistics.
+
+    Attributes:
+        position_by_move: (MAX_MOVES, CELLS) count of moves at each position,
+            indexed by move number - 1
+        position_by_player: (2, CELLS) count of moves at each position by
+            X (row 0) and O (row 1)
+        outcomes_by_opening: (CELLS, 4) count of games by opening square
+            and outcome code (IN_PROGRESS, X_WINS, O_WINS, DRAW)
+        moves_by_opening: (CELLS,) total moves played in finished games,
+            by opening square
+    """
+
+    position_by_move: np.ndarray
+    position_by_player: np.ndarray
+    outcomes_by_opening: np.ndarray
+    moves_by_opening: np.ndarray
+
+    @property
+    def total_moves(self) -> int:
+        """Number of moves aggregated."""
+        return int(self.position_by_move.sum())
+
+    @property
+    def finished_by_opening(self) -> np.ndarray:
+        """Number of finished games by opening square."""
+        return self.outcomes_by_opening[:, X_WINS:].sum(axis=1)
+
+    def win_rate_by_opening(self, player: Player) -> np.ndarray:
+        """
+        Win rate of a player among finished games, by opening square.
+
+        Args:
+            player: Player whose wins to count
+
+        Returns:
+            (CELLS,) array of rates in [0, 1], NaN where no games finished
+        """
+        column = X_WINS if player == Player.X else O_WINS
+        return _ratio(self.outcomes_by_opening[:, column], self.finished_by_opening)
+
+    def average_length_by_opening(self) -> np.ndarray:
+        """
+        Average number of moves in finished games, by opening square.
+
+        Returns:
+            (CELLS,) array of averages, NaN where no games finished
+        """
+        return _ratio(self.moves_by_opening, self.finished_by_opening)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise division that yields NaN where the denominator is zero."""
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _move_columns_query():
+    """
+    Build the query that streams one row per move as plain integers.
+
+    Columns: position, move_number, player (0 = X, 1 = O), opening square
+    of the move's game and outcome code of the move's game.
+    """
+    opening = aliased(Move)
+    player = case((Move.player == Player.X, 0), else_=1)
+    outcome = case(
+        (
+            and_(Game.status == GameStatus.COMPLETED, Game.winner == Player.X),
+            X_WINS,
+        ),
+        (
+            and_(Game.status == GameStatus.COMPLETED, Game.winner == Player.O),
+            O_WINS,
+        ),
+        (Game.status == GameStatus.DRAW, DRAW),
+        else_=IN_PROGRESS,
+    )
+    return (
+        select(Move.position, Move.move_number, player, opening.position, outcome)
+        .join(Game, Game.id == Move.game_id)
+        .join(
+            opening,
+            and_(opening.game_id == Move.game_id, opening.move_number == 1),
+        )
+    )
+
+
+def _accumulate(totals: dict[str, np.ndarray], chunk: np.ndarray) -> None:
+    """
+    Add one chunk of move rows into the running totals.
+
+    Args:
+        totals: Running count arrays, updated in place
+        chunk: (n, 5) integer array with the columns of `_move_columns_query`
+    """
+    position, move_number, player, opening, outcome = chunk.T
+
+    move_index = np.clip(move_number, 1, MAX_MOVES) - 1
+    totals["position_by_move"] += np.bincount(
+        move_index * CELLS + position, minlength=MAX_MOVES * CELLS
+    ).reshape(MAX_MOVES, CELLS)
+    totals["position_by_player"] += np.bincount(
+        player * CELLS + position, minlength=2 * CELLS
+    ).reshape(2, CELLS)
+
+    first = move_number == 1
+    totals["outcomes_by_opening"] += np.bincount(
+        opening[first] * 4 + outcome[first], minlength=CELLS * 4
+    ).reshape(CELLS, 4)
+
+    finished = outcome != IN_PROGRESS
+    totals["moves_by_opening"] += np.bincount(opening[finished], minlength=CELLS)
+
+
+def compute_move_stats(db: Session, chunk_size: int = CHUNK_SIZE) -> MoveStats:
+    """
+    Compute move statistics over every stored move.
+
+    Moves are streamed from the database `chunk_size` rows at a time and
+    folded into fixed-size count arrays, so memory use does not grow with
+    the number of stored moves.
+
+    Args:
+        db: Database session
+        chunk_size: Number of move rows loaded per chunk
+
+    Returns:
+        Aggregated MoveStats
+    """
+    totals = {
+        "position_by_move": np.zeros((MAX_MOVES, CELLS), dtype=np.int64),
+        "position_by_player": np.zeros((2, CELLS), dtype=np.int64),
+        "outcomes_by_opening": np.zeros((CELLS, 4), dtype=np.int64),
+        "moves_by_opening": np.zeros(CELLS, dtype=np.int64),
+    }
+
+    result = db.execute(_move_columns_query().execution_options(yield_per=chunk_size))
+    for partition in result.partitions():
+        _accumulate(totals, np.array(partition, dtype=np.int64).reshape(-1, 5))
+
+    return MoveStats(**totals)
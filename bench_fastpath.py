@@ -0,0 +1,117 @@
+"""Benchmark the per-move SQL path: ORM unit of work vs. prebuilt Core statements.
+
+Plays the same scripted games through each path against an in-memory
+SQLite database (one commit per move, as in the game loop) and then
+reloads every game, reporting moves and loads per second.
+
+    uv run python bench_fastpath.py [games]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+import fastpath
+from db import Base
+from game_logic import apply_move
+from game_state import GameState, from_game, game_values
+from history import load_game_with_moves
+from models import Game, Move, Player
+
+SCRIPTS = [[4, 0, 2, 8, 6], [4, 0, 2, 6, 3, 5, 1, 7, 8]]
+
+
+def orm_save_move(db: Session, state: GameState) -> None:
+    """ORM path: load the row, set attributes, add the Move, flush on commit."""
+    game = db.get(Game, state.game_id)
+    for name, value in game_values(state).items():
+        setattr(game, name, value)
+    position = state.moves[-1]
+    db.add(
+        Move(
+            game_id=state.game_id,
+            player=Player(state.board[position]),
+            position=position,
+            move_number=state.move_count,
+        )
+    )
+    db.commit()
+
+
+def orm_bulk_save_move(db: Session, state: GameState) -> None:
+    """ORM path without loading the row: bulk UPDATE by primary key + add Move."""
+    db.execute(update(Game), [game_values(state)])
+    position = state.moves[-1]
+    db.add(
+        Move(
+            game_id=state.game_id,
+            player=Player(state.board[position]),
+            position=position,
+            move_number=state.move_count,
+        )
+    )
+    db.commit()
+
+
+def orm_load_game(db: Session, game_id: int) -> GameState:
+    """ORM path: joined-load the game and its moves, then convert."""
+    state = from_game(load_game_with_moves(db, game_id))
+    db.expunge_all()
+    return state
+
+
+PATHS = {
+    "orm": (orm_save_move, orm_load_game),
+    "orm-bulk": (orm_bulk_save_move, orm_load_game),
+    "core": (fastpath.save_move, fastpath.load_game),
+}
+
+
+def run(save_move, load_game, games: int) -> tuple[float, float]:
+    """Return (moves per second, loads per second) for one path."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        game_ids = []
+        for _ in range(games):
+            game = Game()
+            db.add(game)
+            db.commit()
+            game_ids.append(game.id)
+        db.expunge_all()
+
+        move_count = 0
+        start = time.perf_counter()
+        for i, game_id in enumerate(game_ids):
+            state = GameState(game_id=game_id)
+            for position in SCRIPTS[i % len(SCRIPTS)]:
+                state = apply_move(state, position)
+                save_move(db, state)
+                move_count += 1
+        moves_per_second = move_count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for game_id in game_ids:
+            load_game(db, game_id)
+        loads_per_second = len(game_ids) / (time.perf_counter() - start)
+
+    engine.dispose()
+    return moves_per_second, loads_per_second
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{'path':<10}{'moves/s':>12}{'loads/s':>12}")
+    for name, (save_move, load_game) in PATHS.items():
+        moves_per_second, loads_per_second = run(save_move, load_game, games)
+        print(f"{name:<10}{moves_per_second:>12,.0f}{loads_per_second:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark the game loop: ORM-mutating turns vs. GameState turns.
+
+Plays the same scripted games through both loops against an in-memory
+SQLite database and reports per-turn latency and allocations.
+
+    uv run python bench_game_state.py [games]
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from db import Base
+from game_logic import (
+    apply_move,
+    check_draw,
+    check_winner,
+    get_move_count,
+    get_next_player,
+    make_move,
+)
+from game_state import from_game
+from models import Game, GameStatus, Move
+from store import SqlGameStore
+
+# X wins on move 5, then a full-board draw.
+SCRIPTS = [[4, 0, 2, 8, 6], [4, 0, 2, 6, 3, 5, 1, 7, 8]]
+
+
+def play_orm(db: Session, game: Game, positions: list[int]) -> list[float]:
+    """Legacy loop: every turn mutates the live Game row."""
+    timings = []
+    for position in positions:
+        if game.status != GameStatus.IN_PROGRESS:
+            break
+        start = time.perf_counter()
+        player = game.current_player
+        game.board_state = make_move(game.board_state, position, player)
+        db.add(
+            Move(
+                game_id=game.id,
+                player=player,
+                position=position,
+                move_number=get_move_count(game.board_state),
+            )
+        )
+        db.commit()
+        winner = check_winner(game.board_state)
+        if winner:
+            game.winner = winner
+            game.status = GameStatus.COMPLETED
+        elif check_draw(game.board_state):
+            game.status = GameStatus.DRAW
+        else:
+            game.current_player = get_next_player(game.current_player)
+        db.commit()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def play_state(db: Session, game: Game, positions: list[int]) -> list[float]:
+    """Current loop: turns run on a GameState, one commit per turn."""
+    timings = []
+    store = SqlGameStore(db)
+    state = from_game(game)
+    for position in positions:
+        if state.status != GameStatus.IN_PROGRESS:
+            break
+        start = time.perf_counter()
+        state = apply_move(state, position)
+        store.save_move(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(loop, games: int) -> tuple[list[float], int, int]:
+    """Play `games` games with `loop`, returning timings, retained blocks, peak bytes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    timings: list[float] = []
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    with session_factory() as db:
+        for i in range(games):
+            game = Game()
+            db.add(game)
+            db.commit()
+            timings.extend(loop(db, game, SCRIPTS[i % len(SCRIPTS)]))
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    retained = sum(
+        stat.count_diff
+        for stat in after.compare_to(before, "filename")
+        if stat.count_diff > 0
+    )
+    engine.dispose()
+    return timings, retained, peak
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(
+        f"{'loop':<10}{'turns':>8}{'mean µs':>12}{'p50 µs':>12}{'p99 µs':>12}"
+        f"{'blocks/turn':>14}{'peak KiB':>12}"
+    )
+    for name, loop in [("orm", play_orm), ("gamestate", play_state)]:
+        timings, retained, peak = run(loop, games)
+        quantiles = statistics.quantiles(timings, n=100)
+        print(
+            f"{name:<10}{len(timings):>8}"
+            f"{statistics.fmean(timings) * 1e6:>12.1f}"
+            f"{quantiles[49] * 1e6:>12.1f}"
+            f"{quantiles[98] * 1e6:>12.1f}"
+            f"{retained / len(timings):>14.1f}"
+            f"{peak / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
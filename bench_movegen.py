@@ -0,0 +1,41 @@
+"""Benchmark move generation: bitboard make/unmake vs. the string API.
+
+Counts perft nodes (leaves of the game tree to each depth) from the
+empty board with `movegen.Board` and with `game_logic` strings, and
+reports nodes per second for each.
+
+    uv run python bench_movegen.py [max_depth]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from models import Player
+from movegen import Board, perft, perft_string
+
+
+def timed(count, *args) -> tuple[int, float]:
+    """Return (nodes, nodes per second) for one perft run."""
+    start = time.perf_counter()
+    nodes = count(*args)
+    return nodes, nodes / (time.perf_counter() - start)
+
+
+def main() -> None:
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+    print(f"{'depth':<7}{'nodes':>10}{'board/s':>14}{'string/s':>14}{'speedup':>9}")
+    for depth in range(1, max_depth + 1):
+        nodes, board_rate = timed(perft, Board(), depth)
+        string_nodes, string_rate = timed(perft_string, "---------", Player.X, depth)
+        assert nodes == string_nodes
+        print(
+            f"{depth:<7}{nodes:>10,}{board_rate:>14,.0f}{string_rate:>14,.0f}"
+            f"{board_rate / string_rate:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark tablebase lookups: shared mmap file vs. per-process solve.
+
+Spawns worker processes that each either open the tablebase file or
+solve the game in memory, then time lookups of every reachable board and
+report lookups per second and resident memory per process.
+
+    uv run python bench_tablebase.py [workers] [rounds]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from tablebase import Tablebase, generate, solve
+
+
+def rss_kib() -> dict[str, int]:
+    """Read resident memory figures (KiB) for this process from /proc."""
+    figures = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "RssAnon", "RssFile"):
+                figures[key] = int(value.split()[0])
+    return figures
+
+
+def worker(mode: str, path: str, boards: list[str], rounds: int) -> tuple:
+    """Load the table in the given mode and time `rounds` passes over `boards`."""
+    if mode == "mmap":
+        tablebase = Tablebase(path)
+        lookup = tablebase.lookup
+    else:
+        lookup = solve().get
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for board_state in boards:
+            lookup(board_state)
+    elapsed = time.perf_counter() - start
+    return len(boards) * rounds / elapsed, rss_kib()
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    boards = list(solve())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tablebase.bin")
+        start = time.perf_counter()
+        generate(path)
+        print(
+            f"generated {len(boards)} positions, {os.path.getsize(path)} bytes "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+        print(
+            f"{'mode':<8}{'workers':>8}{'lookups/s/proc':>16}{'total lookups/s':>17}"
+            f"{'RSS KiB':>10}{'anon KiB':>10}{'file KiB':>10}"
+        )
+        context = multiprocessing.get_context("spawn")
+        for mode in ("mmap", "memory"):
+            with context.Pool(workers) as pool:
+                results = pool.starmap(worker, [(mode, path, boards, rounds)] * workers)
+            rates = [rate for rate, _ in results]
+            rss = [figures for _, figures in results]
+            print(
+                f"{mode:<8}{workers:>8}"
+                f"{sum(rates) / workers:>16,.0f}{sum(rates):>17,.0f}"
+                f"{sum(r['VmRSS'] for r in rss) // workers:>10}"
+                f"{sum(r['RssAnon'] for r in rss) // workers:>10}"
+                f"{sum(r['RssFile'] for r in rss) // workers:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark tournament throughput as the number of worker processes grows.
+
+Plays the same round-robin schedule with 1..N worker processes against
+an in-memory SQLite database and reports games per second, speedup over
+one worker and parallel efficiency (speedup / workers).
+
+    uv run python bench_tournament.py [max_workers] [games_per_pair]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from db import Base
+from strategies import STRATEGIES
+from tournament import run_tournament
+
+
+def run(workers: int, games_per_pair: int) -> tuple[int, float]:
+    """Return (games played, games per second) for one worker count."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        start = time.perf_counter()
+        played = run_tournament(
+            db,
+            f"bench-{workers}",
+            list(STRATEGIES),
+            games_per_pair,
+            workers=workers,
+            results_only=True,
+        )
+        elapsed = time.perf_counter() - start
+    engine.dispose()
+    return played, played / elapsed
+
+
+def main() -> None:
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    games_per_pair = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f"{os.cpu_count()} CPUs, {games_per_pair} games per pair")
+    print(f"{'workers':<9}{'games':>8}{'games/s':>12}{'speedup':>10}{'efficiency':>12}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        played, rate = run(workers, games_per_pair)
+        baseline = baseline or rate
+        speedup = rate / baseline
+        print(
+            f"{workers:<9}{played:>8,}{rate:>12,.0f}"
+            f"{speedup:>9.2f}x{speedup / workers:>12.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
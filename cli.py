@@ -1,30 +1,41 @@
 """Command-line interface for tic-tac-toe game."""
 
-from sqlalchemy.orm import Session
+from collections.abc import Sequence
 
-from db import SessionLocal, init_db
-from game_logic import (
-    check_draw,
-    check_winner,
-    get_move_count,
-    get_next_player,
-    is_valid_move,
-    make_move,
-)
-from models import Game, GameStatus, Move, Player
+import numpy as np
 
+from analytics import MoveStats, compute_move_stats
+from game_logic import apply_move, get_move_count, is_valid_move
+from game_state import GameState
+from history import Replay
+from models import GameStatus, Player
+from store import GameStore, SqlGameStore, open_store
 
-def display_board(board_state: str):
-    """Display the board in a readable format."""
+
+def display_grid(cells: Sequence[str]):
+    """
+    Display 9 cells on the 3x3 board grid.
+
+    Args:
+        cells: Cell contents for positions 0-8; padded to a common width
+    """
+    width = max(len(cell) for cell in cells)
+    padded = [cell.center(width) for cell in cells]
+    separator = "┼".join(["─" * (width + 2)] * 3)
     print("\n")
-    print(f" {board_state[0]} │ {board_state[1]} │ {board_state[2]} ")
-    print("───┼───┼───")
-    print(f" {board_state[3]} │ {board_state[4]} │ {board_state[5]} ")
-    print("───┼───┼───")
-    print(f" {board_state[6]} │ {board_state[7]} │ {board_state[8]} ")
+    print(f" {padded[0]} │ {padded[1]} │ {padded[2]} ")
+    print(separator)
+    print(f" {padded[3]} │ {padded[4]} │ {padded[5]} ")
+    print(separator)
+    print(f" {padded[6]} │ {padded[7]} │ {padded[8]} ")
     print()
 
 
+def display_board(board_state: str):
+    """Display the board in a readable format."""
+    display_grid(board_state)
+
+
 def display_positions():
     """Display the position numbers for reference."""
     print("\nPosition numbers:")
@@ -71,118 +82,70 @@ def get_player_move(board_state: str, player: Player) -> int:
             return -1
 
 
-def save_move_to_db(db: Session, game: Game, position: int, player: Player) -> None:
-    """
-    Save a move to the database.
-
-    Args:
-        db: Database session
-        game: Game instance
-        position: Move position
-        player: Player who made the move
-    """
-    move_number = get_move_count(game.board_state)
-    move = Move(
-        game_id=game.id,
-        player=player,
-        position=position,
-        move_number=move_number,
-    )
-    db.add(move)
-    db.commit()
-
-
-def play_game(db: Session, game: Game) -> None:
+def play_game(store: GameStore, state: GameState) -> None:
     """
     Main game loop.
 
+    Turns are applied to an in-memory GameState; the store persists each
+    move as it is made and is flushed when the game is paused or over.
+
     Args:
-        db: Database session
-        game: Game instance to play
+        store: Game store
+        state: Game state to play
     """
     print("\n" + "=" * 50)
-    print(f"🎮 TIC-TAC-TOE - Game #{game.id}")
+    print(f"🎮 TIC-TAC-TOE - Game #{state.game_id}")
     print("=" * 50)
     display_positions()
 
-    while game.status == GameStatus.IN_PROGRESS:
-        display_board(game.board_state)
-        print(f"Current player: {game.current_player.value.upper()}")
+    while state.status == GameStatus.IN_PROGRESS:
+        display_board(state.board)
+        print(f"Current player: {state.current_player.value.upper()}")
 
-        position = get_player_move(game.board_state, game.current_player)
+        position = get_player_move(state.board, state.current_player)
 
         if position == -1:
+            store.flush()
             print("\n👋 Game saved! You can resume later.")
             return
 
-        game.board_state = make_move(game.board_state, position, game.current_player)
-        save_move_to_db(db, game, position, game.current_player)
+        state = apply_move(state, position)
+        store.save_move(state)
 
-        winner = check_winner(game.board_state)
-        if winner:
-            game.winner = winner
-            game.status = GameStatus.COMPLETED
-            db.commit()
-            display_board(game.board_state)
-            print("=" * 50)
-            print(f"🎉 GAME OVER! Player {winner.value.upper()} wins!")
-            print("=" * 50)
-            display_game_history(db, game)
-            return
-
-        if check_draw(game.board_state):
-            game.status = GameStatus.DRAW
-            db.commit()
-            display_board(game.board_state)
-            print("=" * 50)
-            print("🤝 GAME OVER! It's a draw!")
-            print("=" * 50)
-            display_game_history(db, game)
-            return
-
-        game.current_player = get_next_player(game.current_player)
-        db.commit()
+    store.flush()
+    display_board(state.board)
+    print("=" * 50)
+    if state.status == GameStatus.COMPLETED:
+        print(f"🎉 GAME OVER! Player {state.winner.value.upper()} wins!")
+    else:
+        print("🤝 GAME OVER! It's a draw!")
+    print("=" * 50)
+    display_game_history(state)
 
 
-def display_game_history(db: Session, game: Game) -> None:
+def display_game_history(state: GameState) -> None:
     """
     Display the move history for a game.
 
     Args:
-        db: Database session
-        game: Game instance
+        state: Game state
     """
-    db.refresh(game)
-    if not game.moves:
+    if not state.moves:
         return
 
     print("\n📜 Game History:")
-    for move in game.moves:
-        print(
-            f"  Move {move.move_number}: {move.player.value.upper()} → position {move.position}"
-        )
+    for number, position in enumerate(state.moves, start=1):
+        player = state.board[position]
+        print(f"  Move {number}: {player.upper()} → position {position}")
     print()
 
 
-def list_saved_games(db: Session) -> list[Game]:
-    """
-    List all saved games.
-
-    Args:
-        db: Database session
-
-    Returns:
-        List of Game instances
-    """
-    return db.query(Game).order_by(Game.created_at.desc()).all()
-
-
-def display_saved_games(games: list[Game]) -> None:
+def display_saved_games(games: list[GameState]) -> None:
     """
     Display a list of saved games.
 
     Args:
-        games: List of Game instances
+        games: List of game states
     """
     if not games:
         print("\n📂 No saved games found.")
@@ -205,53 +168,22 @@ def display_saved_games(games: list[Game]) -> None:
         else:
             info = f"Turn: {game.current_player.value.upper()}"
 
-        move_count = get_move_count(game.board_state)
+        move_count = get_move_count(game.board)
         print(
-            f"  {status_text} Game #{game.id} | {info} | "
+            f"  {status_text} Game #{game.game_id} | {info} | "
             f"Moves: {move_count} | {game.created_at.strftime('%Y-%m-%d %H:%M')}"
         )
     print("-" * 70)
 
 
-def load_game(db: Session, game_id: int) -> Game | None:
-    """
-    Load a game by ID.
-
-    Args:
-        db: Database session
-        game_id: Game ID to load
-
-    Returns:
-        Game instance or None if not found
-    """
-    return db.query(Game).filter(Game.id == game_id).first()
-
-
-def new_game(db: Session) -> Game:
-    """
-    Create a new game.
-
-    Args:
-        db: Database session
-
-    Returns:
-        New Game instance
-    """
-    game = Game()
-    db.add(game)
-    db.commit()
-    db.refresh(game)
-    return game
-
-
-def handle_load_game(db: Session) -> None:
+def handle_load_game(store: GameStore) -> None:
     """
     Handle loading a saved game.
 
     Args:
-        db: Database session
+        store: Game store
     """
-    games = list_saved_games(db)
+    games = store.list_games()
     display_saved_games(games)
 
     if not games:
@@ -262,40 +194,136 @@ def handle_load_game(db: Session) -> None:
         if game_id == 0:
             return
 
-        game = load_game(db, game_id)
+        # Finished games can be shown from a replica, but a game about to be
+        # resumed (or one the replica does not have yet) must be read from
+        # the write database, or moves would be saved on a stale board.
+        # Without replicas every load is current, so one load is enough.
+        game = store.load_game(game_id, for_write=not store.has_replicas)
+        if store.has_replicas and (
+            game is None or game.status == GameStatus.IN_PROGRESS
+        ):
+            game = store.load_game(game_id, for_write=True)
         if game:
             if game.status != GameStatus.IN_PROGRESS:
                 print("\n⚠️  This game is already finished. Showing final state...")
-                display_board(game.board_state)
+                display_board(game.board)
                 if game.status == GameStatus.COMPLETED:
                     print(f"Winner: {game.winner.value.upper()}")
                 else:
                     print("Result: Draw")
-                display_game_history(db, game)
+                display_game_history(game)
+                if input("Step through the replay? (y/N): ").strip().lower() == "y":
+                    handle_replay(Replay.from_state(game))
             else:
-                play_game(db, game)
+                play_game(store, game)
         else:
             print(f"\n❌ Game #{game_id} not found.")
     except ValueError:
         print("\n❌ Invalid game ID.")
 
 
-def handle_list_games(db: Session) -> None:
+def handle_replay(replay: Replay) -> None:
+    """
+    Step through a game's board states.
+
+    Args:
+        replay: Replay of the game
+    """
+    while True:
+        display_board(replay.board)
+        print(f"Move {replay.index}/{len(replay)}")
+        command = input("\n'n' next, 'p' previous, 'q' quit: ").strip().lower()
+        if command == "n":
+            replay.step_forward()
+        elif command == "p":
+            replay.step_back()
+        elif command == "q":
+            return
+
+
+def handle_list_games(store: GameStore) -> None:
     """
     Handle listing all games.
 
     Args:
-        db: Database session
+        store: Game store
     """
-    games = list_saved_games(db)
+    games = store.list_games()
     display_saved_games(games)
     input("\nPress Enter to continue...")
 
 
+def display_heatmap(title: str, values: np.ndarray, fmt: str) -> None:
+    """
+    Display per-position values on the board grid.
+
+    Args:
+        title: Heading printed above the grid
+        values: (9,) array of values, NaN for positions without data
+        fmt: Format spec applied to each value
+    """
+    print(f"\n{title}")
+    display_grid(["-" if np.isnan(v) else format(v, fmt) for v in values])
+
+
+def display_move_stats(stats: MoveStats) -> None:
+    """
+    Display move statistics as heatmaps on the board grid.
+
+    Args:
+        stats: Aggregated move statistics
+    """
+    if not stats.total_moves:
+        print("\n📊 No moves recorded yet.")
+        return
+
+    print(f"\n📊 Stats over {stats.total_moves} moves")
+
+    shares = stats.position_by_move / stats.total_moves
+    display_heatmap("Position frequency (all moves):", shares.sum(axis=0), ".0%")
+    for index, row in enumerate(stats.position_by_move):
+        if row.any():
+            display_heatmap(
+                f"Position frequency on move {index + 1}:", row / row.sum(), ".0%"
+            )
+
+    display_heatmap(
+        "X win rate by opening square:",
+        stats.win_rate_by_opening(Player.X),
+        ".0%",
+    )
+    display_heatmap(
+        "O win rate by opening square:",
+        stats.win_rate_by_opening(Player.O),
+        ".0%",
+    )
+    display_heatmap(
+        "Average game length by opening square:",
+        stats.average_length_by_opening(),
+        ".1f",
+    )
+
+
+def handle_stats(store: GameStore) -> None:
+    """
+    Handle showing move statistics.
+
+    Args:
+        store: Game store
+    """
+    if not isinstance(store, SqlGameStore):
+        print("\n📊 Stats are only available with the database backend.")
+        return
+
+    with store.read_session() as db:
+        stats = compute_move_stats(db)
+    display_move_stats(stats)
+    input("\nPress Enter to continue...")
+
+
 def main_menu():
     """Display and handle the main menu."""
-    init_db()
-    db = SessionLocal()
+    store = open_store()
 
     try:
         while True:
@@ -305,27 +333,29 @@ def main_menu():
             print("\n1. New Game")
             print("2. Load Game")
             print("3. List All Games")
-            print("4. Quit")
+            print("4. Stats")
+            print("5. Quit")
 
-            choice = input("\nEnter your choice (1-4): ").strip()
+            choice = input("\nEnter your choice (1-5): ").strip()
 
             if choice == "1":
-                game = new_game(db)
-                play_game(db, game)
+                play_game(store, store.new_game())
             elif choice == "2":
-                handle_load_game(db)
+                handle_load_game(store)
             elif choice == "3":
-                handle_list_games(db)
-            elif choice == "4" or choice.lower() == "q":
+                handle_list_games(store)
+            elif choice == "4":
+                handle_stats(store)
+            elif choice == "5" or choice.lower() == "q":
                 print("\n👋 Thanks for playing! Goodbye!")
                 break
             else:
-                print("\n❌ Invalid choice. Please enter 1-4.")
+                print("\n❌ Invalid choice. Please enter 1-5.")
 
     except KeyboardInterrupt:
         print("\n\n👋 Thanks for playing! Goodbye!")
     finally:
-        db.close()
+        store.close()
 
 
 if __name__ == "__main__":
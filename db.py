@@ -1,8 +1,11 @@
+import itertools
 import os
+import time
+from collections import OrderedDict
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 load_dotenv()
 
@@ -11,11 +14,113 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+# Optional comma-separated replica URLs for listing, history and analytics.
+READ_DATABASE_URLS = [
+    url.strip() for url in os.getenv("READ_DATABASE_URLS", "").split(",") if url.strip()
+]
+REPLICA_LAG_SECONDS = float(os.getenv("REPLICA_LAG_SECONDS", "5"))
+
 engine = create_engine(DATABASE_URL, echo=True, future=True)
+read_engines = [
+    create_engine(url, echo=True, future=True) for url in READ_DATABASE_URLS
+]
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+class SessionRouter:
+    """
+    Route sessions between the write engine and read replicas.
+
+    Writes (move application) always use the write engine. Reads rotate
+    over the read engines, except that a game written in this process
+    within the last `lag_seconds` is read from the write engine, so a
+    client always sees its own moves even if the replicas lag behind.
+    Reads not tied to one game (listings, analytics) always use the read
+    engines; callers that need their own games in a listing overlay
+    `recent_writes()` read from the write engine.
+    """
+
+    def __init__(
+        self,
+        write_engine: Engine,
+        read_engines: list[Engine] | None = None,
+        lag_seconds: float = REPLICA_LAG_SECONDS,
+    ):
+        self.write_engine = write_engine
+        self.read_engines = read_engines or [write_engine]
+        self.lag_seconds = lag_seconds
+        self._write_factory = sessionmaker(autoflush=False, bind=write_engine)
+        self._read_factories = itertools.cycle(
+            [sessionmaker(autoflush=False, bind=e) for e in self.read_engines]
+        )
+        # Game ID -> time of its last write, oldest first.
+        self._recent_writes: OrderedDict[int, float] = OrderedDict()
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether reads can go anywhere other than the write engine."""
+        return self.read_engines != [self.write_engine]
+
+    def write_session(self) -> Session:
+        """Open a session on the write engine."""
+        return self._write_factory()
+
+    def mark_written(self, game_id: int) -> None:
+        """
+        Record that a game was just written.
+
+        Args:
+            game_id: ID of the written game
+        """
+        now = time.monotonic()
+        self._recent_writes[game_id] = now
+        self._recent_writes.move_to_end(game_id)
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Forget writes older than the lag window (they are at the front)."""
+        while self._recent_writes:
+            written_at = next(iter(self._recent_writes.values()))
+            if now - written_at < self.lag_seconds:
+                return
+            self._recent_writes.popitem(last=False)
+
+    def recent_writes(self) -> list[int]:
+        """
+        Get the games written within the lag window.
+
+        Returns:
+            Game IDs, oldest write first
+        """
+        self._prune(time.monotonic())
+        return list(self._recent_writes)
+
+    def read_session(self, game_id: int | None = None) -> Session:
+        """
+        Open a session for reads.
+
+        Args:
+            game_id: Game about to be read, or None for listings/analytics,
+                which always go to a read engine
+
+        Returns:
+            Session on a read engine, or on the write engine if `game_id`
+            was written within the lag window (read-your-writes)
+        """
+        if game_id is not None:
+            written_at = self._recent_writes.get(game_id)
+            if (
+                written_at is not None
+                and time.monotonic() - written_at < self.lag_seconds
+            ):
+                return self._write_factory()
+        return next(self._read_factories)()
+
+
+router = SessionRouter(engine, read_engines)
+
+
 def get_db():
     """Generator function for database session dependency injection."""
     db = SessionLocal()
@@ -27,4 +132,8 @@ def get_db():
 
 def init_db():
     """Initialize database by creating all tables."""
-    Base.metadata.create_all(bind=engine)
+    # Replicas normally get the schema through replication, in which case
+    # create_all only checks that the tables exist; separate local
+    # databases standing in for replicas get their own tables.
+    for bind in [engine, *read_engines]:
+        Base.metadata.create_all(bind=bind)
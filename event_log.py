@@ -0,0 +1,346 @@
+"""Append-only move event log with periodic snapshots.
+
+A database-free GameStore. Every game creation and move is appended to a
+log file as a fixed-size binary record (little-endian):
+
+    header  magic "TTTL", format version, log id      (HEADER, 22 bytes)
+    events  kind, game id, position, unix timestamp   (EVENT, 14 bytes)
+
+Appends are buffered and written with one fsync per batch of `batch_size`
+events (group commit), so a crash can lose at most the unflushed batch;
+callers make a game durable sooner with `flush` (the CLI does when a
+game is paused or finished).
+Every `snapshot_every` events the live game states are written to
+`<path>.snapshot` together with the log id and the log offset they cover.
+On startup the state is rebuilt from the snapshot plus the log tail after
+that offset; a snapshot of another log (e.g. left over from a deleted one)
+is ignored, and a torn record at the end of the log is truncated.
+
+Only one process may use a log at a time: the store holds an exclusive
+`flock` on it while open.
+
+`read_events` can tail the log from any offset, which is how a separate
+consumer can stream events into the database asynchronously.
+"""
+
+import fcntl
+import json
+import os
+import struct
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import BinaryIO, NamedTuple
+
+from game_logic import apply_move
+from game_state import GameState
+from models import GameStatus, Player
+
+MAGIC = b"TTTL"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sH16s")
+EVENT = struct.Struct("<BIBd")
+BATCH_SIZE = 64
+SNAPSHOT_EVERY = 10_000
+
+NEW_GAME = 1
+MOVE = 2
+
+
+class EventLogError(Exception):
+    """Raised when a log or snapshot file is corrupt or incompatible."""
+
+
+class Event(NamedTuple):
+    """One log record; `position` is unused (0) for NEW_GAME events."""
+
+    kind: int
+    game_id: int
+    position: int
+    timestamp: float
+
+
+def read_log_id(f: BinaryIO, path: str) -> str:
+    """
+    Read and validate a log header.
+
+    Args:
+        f: Log file opened for binary reading, positioned at the start
+        path: Log file path, for error messages
+
+    Returns:
+        Log id (hex), which ties snapshots to the log they were taken of
+    """
+    data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise EventLogError(f"{path}: truncated event log header")
+    magic, version, log_id = HEADER.unpack(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise EventLogError(f"{path}: not a version {FORMAT_VERSION} event log")
+    return log_id.hex()
+
+
+def read_events(path: str, offset: int = HEADER.size) -> Iterator[tuple[int, Event]]:
+    """
+    Read complete events from a log file.
+
+    Args:
+        path: Log file path
+        offset: Byte offset to start reading from (default: first event)
+
+    Yields:
+        (offset just past the event, event) pairs; a trailing partial
+        record is ignored
+    """
+    with open(path, "rb") as f:
+        read_log_id(f, path)
+        f.seek(offset)
+        while True:
+            data = f.read(EVENT.size * 4096)
+            usable = len(data) - len(data) % EVENT.size
+            for start in range(0, usable, EVENT.size):
+                offset += EVENT.size
+                yield offset, Event(*EVENT.unpack_from(data, start))
+            if usable < len(data) or len(data) < EVENT.size * 4096:
+                return
+
+
+class EventLogStore:
+    """GameStore that keeps games in memory, backed by an event log file."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = BATCH_SIZE,
+        snapshot_every: int = SNAPSHOT_EVERY,
+    ):
+        """
+        Open a log file, creating it or recovering the games stored in it.
+
+        Args:
+            path: Log file path; the snapshot is written next to it
+            batch_size: Number of events buffered per fsync
+            snapshot_every: Number of events between snapshots
+
+        Raises:
+            EventLogError: If another process has the log open, or the log
+                or its snapshot is corrupt
+        """
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.batch_size = batch_size
+        self.snapshot_every = snapshot_every
+
+        self._games: dict[int, GameState] = {}
+        self._next_id = 1
+        self._offset = HEADER.size
+        self._pending = bytearray()
+        self._pending_events = 0
+        self._since_snapshot = 0
+
+        # Lock before recovery, which may rewrite or truncate the log.
+        self._file = open(path, "ab")
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._file.close()
+            raise EventLogError(f"{path}: in use by another process") from None
+        try:
+            self._recover()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _recover(self) -> None:
+        """Rebuild in-memory state from the snapshot and the log tail."""
+        if os.path.getsize(self.path) < HEADER.size:
+            # New log (or a crash while writing its header): any snapshot
+            # next to it belongs to an earlier log and must not be loaded.
+            if os.path.exists(self.snapshot_path):
+                os.remove(self.snapshot_path)
+            log_id = uuid.uuid4()
+            self._file.truncate(0)
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, log_id.bytes))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.log_id = log_id.hex
+            return
+
+        with open(self.path, "rb") as f:
+            self.log_id = read_log_id(f, self.path)
+        if os.path.exists(self.snapshot_path):
+            self._load_snapshot()
+
+        for offset, event in read_events(self.path, self._offset):
+            self._apply(event)
+            self._offset = offset
+            self._since_snapshot += 1
+
+        if os.path.getsize(self.path) > self._offset:
+            os.truncate(self.path, self._offset)
+
+    def _load_snapshot(self) -> None:
+        """
+        Restore game states and the covered log offset from the snapshot.
+
+        A snapshot taken of a different log is ignored (the whole log is
+        replayed instead).
+        """
+        with open(self.snapshot_path) as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != FORMAT_VERSION:
+            raise EventLogError(f"{self.snapshot_path}: unsupported snapshot")
+        if snapshot["log_id"] != self.log_id:
+            return
+        if snapshot["offset"] > os.path.getsize(self.path):
+            raise EventLogError(
+                f"{self.snapshot_path}: covers offset {snapshot['offset']}, "
+                f"past the end of {self.path}"
+            )
+
+        self._offset = snapshot["offset"]
+        self._next_id = snapshot["next_id"]
+        for game_id, created, board, player, status, winner, moves in snapshot["games"]:
+            self._games[game_id] = GameState(
+                game_id=game_id,
+                board=board,
+                current_player=Player(player),
+                status=GameStatus(status),
+                winner=Player(winner) if winner else None,
+                moves=tuple(moves),
+                created_at=datetime.fromtimestamp(created, UTC),
+            )
+
+    def _apply(self, event: Event) -> None:
+        """
+        Apply an event to the in-memory game states.
+
+        Args:
+            event: Event read from the log or about to be appended
+        """
+        if event.kind == NEW_GAME:
+            self._games[event.game_id] = GameState(
+                game_id=event.game_id,
+                created_at=datetime.fromtimestamp(event.timestamp, UTC),
+            )
+            self._next_id = max(self._next_id, event.game_id + 1)
+        elif event.kind == MOVE:
+            self._games[event.game_id] = apply_move(
+                self._games[event.game_id], event.position
+            )
+        else:
+            raise EventLogError(f"{self.path}: unknown event kind {event.kind}")
+
+    def _append(self, event: Event) -> None:
+        """
+        Buffer an event, flushing once `batch_size` events are pending.
+
+        Args:
+            event: Event to append
+        """
+        self._pending += EVENT.pack(*event)
+        self._pending_events += 1
+        if self._pending_events >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events with a single fsync."""
+        if not self._pending:
+            return
+
+        self._file.write(self._pending)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._offset += len(self._pending)
+        self._since_snapshot += self._pending_events
+        self._pending.clear()
+        self._pending_events = 0
+
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """Write all game states, covering the log up to the current offset."""
+        self.flush()
+        snapshot = {
+            "version": FORMAT_VERSION,
+            "log_id": self.log_id,
+            "offset": self._offset,
+            "next_id": self._next_id,
+            "games": [
+                [
+                    state.game_id,
+                    state.created_at.timestamp(),
+                    state.board,
+                    state.current_player.value,
+                    state.status.value,
+                    state.winner.value if state.winner else None,
+                    list(state.moves),
+                ]
+                for state in self._games.values()
+            ],
+        }
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._since_snapshot = 0
+
+    def new_game(self) -> GameState:
+        """
+        Create a new game and append its NEW_GAME event.
+
+        Returns:
+            State of the new game
+        """
+        event = Event(NEW_GAME, self._next_id, 0, time.time())
+        self._apply(event)
+        self._append(event)
+        return self._games[event.game_id]
+
+    def save_move(self, state: GameState) -> None:
+        """
+        Store a game state and append an event for its latest move.
+
+        Args:
+            state: Game state after the move
+        """
+        self._games[state.game_id] = state
+        self._append(Event(MOVE, state.game_id, state.moves[-1], time.time()))
+
+    def load_game(self, game_id: int, for_write: bool = False) -> GameState | None:
+        """
+        Get a game by ID.
+
+        Args:
+            game_id: Game ID to load
+            for_write: Unused; the in-memory state is always current
+
+        Returns:
+            GameState, or None if not found
+        """
+        return self._games.get(game_id)
+
+    def list_games(self) -> list[GameState]:
+        """
+        List all games.
+
+        Returns:
+            List of GameStates, newest first
+        """
+        return sorted(
+            self._games.values(), key=lambda state: state.created_at, reverse=True
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        """Always False: loads read the in-memory state."""
+        return False
+
+    def close(self) -> None:
+        """Flush pending events and close the log file."""
+        self.flush()
+        self._file.close()
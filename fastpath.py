@@ -0,0 +1,221 @@
+"""Prebuilt SQLAlchemy Core statements for the per-move hot path.
+
+The statements below are built once at import time and executed with
+bound parameters, so each call reuses the same construct (and its entry
+in SQLAlchemy's compiled cache) and skips the ORM unit of work: no
+identity map, no flush, no attribute instrumentation. They write and
+read the same `games`/`moves` rows as the ORM models. Listings page by
+keyset rather than OFFSET.
+"""
+
+from datetime import datetime
+from itertools import groupby
+
+from sqlalchemy import bindparam, insert, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from game_state import GameState
+from models import Game, Move, Player
+
+PAGE_SIZE = 100
+
+games = Game.__table__
+moves = Move.__table__
+
+INSERT_MOVE = (
+    insert(moves)
+    .values(
+        game_id=bindparam("game_id"),
+        player=bindparam("player"),
+        position=bindparam("position"),
+        move_number=bindparam("move_number"),
+    )
+    .returning(moves.c.id)
+)
+
+UPDATE_GAME = (
+    update(games)
+    .where(games.c.id == bindparam("game_id"))
+    .values(
+        board_state=bindparam("new_board_state"),
+        current_player=bindparam("new_current_player"),
+        status=bindparam("new_status"),
+        winner=bindparam("new_winner"),
+    )
+    .returning(games.c.updated_at)
+)
+
+_GAME_COLUMNS = (
+    games.c.id,
+    games.c.board_state,
+    games.c.current_player,
+    games.c.status,
+    games.c.winner,
+    games.c.created_at,
+)
+
+LOAD_GAME = (
+    select(*_GAME_COLUMNS, moves.c.position)
+    .outerjoin(moves, moves.c.game_id == games.c.id)
+    .where(games.c.id == bindparam("game_id"))
+    .order_by(moves.c.move_number)
+)
+
+# Listings read the game columns only, one row per game (a game's moves
+# are loaded when it is opened), and page by keyset on (created_at, id),
+# newest first: each page seeks past the last key of the previous one
+# through ix_games_created_at_id instead of re-scanning skipped rows, and
+# games inserted meanwhile cannot shift pages.
+PageKey = tuple[datetime, int]
+
+FIRST_PAGE = (
+    select(*_GAME_COLUMNS)
+    .order_by(games.c.created_at.desc(), games.c.id.desc())
+    .limit(bindparam("limit"))
+)
+NEXT_PAGE = FIRST_PAGE.where(
+    tuple_(games.c.created_at, games.c.id)
+    < tuple_(
+        bindparam("after_created_at", type_=games.c.created_at.type),
+        bindparam("after_id", type_=games.c.id.type),
+    )
+)
+
+
+def insert_move(db: Session, state: GameState) -> int:
+    """
+    Insert the latest move of a game state.
+
+    Args:
+        db: Database session
+        state: Game state after the move
+
+    Returns:
+        ID of the new move row
+    """
+    position = state.moves[-1]
+    return db.execute(
+        INSERT_MOVE,
+        {
+            "game_id": state.game_id,
+            "player": Player(state.board[position]),
+            "position": position,
+            "move_number": state.move_count,
+        },
+    ).scalar_one()
+
+
+def update_game(db: Session, state: GameState) -> datetime:
+    """
+    Write a game state onto its game row.
+
+    Args:
+        db: Database session
+        state: Game state to write
+
+    Returns:
+        New `updated_at` of the row
+    """
+    return db.execute(
+        UPDATE_GAME,
+        {
+            "game_id": state.game_id,
+            "new_board_state": state.board,
+            "new_current_player": state.current_player,
+            "new_status": state.status,
+            "new_winner": state.winner,
+        },
+    ).scalar_one()
+
+
+def save_move(db: Session, state: GameState) -> None:
+    """
+    Persist a turn (the latest move and the resulting game state) in a
+    single commit.
+
+    Args:
+        db: Database session
+        state: Game state after the move
+    """
+    insert_move(db, state)
+    update_game(db, state)
+    db.commit()
+
+
+def _state(columns, moves: tuple[int, ...] = ()) -> GameState:
+    """Build a GameState from the values of the game columns."""
+    game_id, board, player, status, winner, created_at = columns
+    return GameState(
+        game_id=game_id,
+        board=board,
+        current_player=player,
+        status=status,
+        winner=winner,
+        moves=moves,
+        created_at=created_at,
+    )
+
+
+def _states(rows) -> list[GameState]:
+    """Fold (game columns..., position) rows, grouped by game, into GameStates."""
+    return [
+        _state(key, tuple(row[-1] for row in group if row[-1] is not None))
+        for key, group in groupby(rows, key=lambda row: row[:-1])
+    ]
+
+
+def load_game(db: Session, game_id: int) -> GameState | None:
+    """
+    Load a game and its ordered moves in one query.
+
+    Args:
+        db: Database session
+        game_id: Game ID to load
+
+    Returns:
+        GameState, or None if not found
+    """
+    states = _states(db.execute(LOAD_GAME, {"game_id": game_id}))
+    return states[0] if states else None
+
+
+def page_key(state: GameState) -> PageKey:
+    """
+    Get the keyset position of a listed game.
+
+    Args:
+        state: Game state returned by `list_page`
+
+    Returns:
+        (created_at, game_id) to pass as `after` for the next page
+    """
+    return state.created_at, state.game_id
+
+
+def list_page(
+    db: Session, limit: int = PAGE_SIZE, after: PageKey | None = None
+) -> list[GameState]:
+    """
+    List one page of games, newest first, in one query.
+
+    Only the game columns are read, so the states have no `moves`; use
+    `load_game` for a game's history.
+
+    Args:
+        db: Database session
+        limit: Maximum number of games
+        after: `page_key` of the last game of the previous page, or None
+            for the first page
+
+    Returns:
+        List of GameStates
+    """
+    if after is None:
+        rows = db.execute(FIRST_PAGE, {"limit": limit})
+    else:
+        created_at, game_id = after
+        rows = db.execute(
+            NEXT_PAGE,
+            {"limit": limit, "after_created_at": created_at, "after_id": game_id},
+        )
+    return [_state(row) for row in rows]
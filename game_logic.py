@@ -1,5 +1,8 @@
 """Core game logic for tic-tac-toe."""
 
+from dataclasses import replace
+
+from game_state import GameState
 from models import GameStatus, Player
 
 
@@ -122,3 +125,32 @@ def get_move_count(board_state: str) -> int:
         Number of moves made
     """
     return sum(1 for pos in board_state if pos != "-")
+
+
+def apply_move(state: GameState, position: int) -> GameState:
+    """
+    Apply the current player's move to a game state.
+
+    Args:
+        state: Current game state
+        position: Position to place the mark (0-8)
+
+    Returns:
+        New game state with the move applied, status/winner updated and,
+        if the game continues, the turn passed to the other player
+    """
+    board = make_move(state.board, position, state.current_player)
+    status, winner = get_game_status(board)
+    next_player = (
+        get_next_player(state.current_player)
+        if status == GameStatus.IN_PROGRESS
+        else state.current_player
+    )
+    return replace(
+        state,
+        board=board,
+        current_player=next_player,
+        status=status,
+        winner=winner,
+        moves=(*state.moves, position),
+    )
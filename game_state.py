@@ -0,0 +1,81 @@
+"""Lightweight in-memory game state used by the game loop."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from models import Game, GameStatus, Player
+
+EMPTY_BOARD = "---------"
+
+
+@dataclass(frozen=True, slots=True)
+class GameState:
+    """
+    Immutable snapshot of a game, decoupled from the ORM.
+
+    The game loop and `game_logic` work on these plain values; `Game` rows
+    are only read or written at persistence boundaries (see `from_game` and
+    `game_values`).
+
+    Attributes:
+        game_id: Primary key of the backing game, or None if not persisted
+        board: 9-character board string (same format as `Game.board_state`)
+        current_player: Player whose turn it is
+        status: Current game status
+        winner: Winning player, or None
+        moves: Positions played so far, in order
+        created_at: When the game was created, if known
+    """
+
+    game_id: int | None = None
+    board: str = EMPTY_BOARD
+    current_player: Player = Player.X
+    status: GameStatus = GameStatus.IN_PROGRESS
+    winner: Player | None = None
+    moves: tuple[int, ...] = ()
+    created_at: datetime | None = None
+
+    @property
+    def move_count(self) -> int:
+        """Number of moves made so far."""
+        return len(self.moves)
+
+
+def from_game(game: Game) -> GameState:
+    """
+    Build a GameState from a Game row.
+
+    Args:
+        game: Game instance
+
+    Returns:
+        GameState mirroring the game and its ordered moves
+    """
+    return GameState(
+        game_id=game.id,
+        board=game.board_state,
+        current_player=game.current_player,
+        status=game.status,
+        winner=game.winner,
+        moves=tuple(move.position for move in game.moves),
+        created_at=game.created_at,
+    )
+
+
+def game_values(state: GameState) -> dict:
+    """
+    Get the Game column values for a GameState.
+
+    Args:
+        state: Game state to write
+
+    Returns:
+        Mapping of Game attribute names to values, including the primary key
+    """
+    return {
+        "id": state.game_id,
+        "board_state": state.board,
+        "current_player": state.current_player,
+        "status": state.status,
+        "winner": state.winner,
+    }
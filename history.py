@@ -0,0 +1,233 @@
+"""Game history loading, replay and export.
+
+Export every game's moves as JSON lines (read from a replica if one is
+configured):
+
+    uv run python history.py export games.jsonl
+"""
+
+import argparse
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from db import router
+from game_state import EMPTY_BOARD, GameState
+from models import Game, Move, Player
+
+# Maximum number of game IDs bound into one IN (...) clause.
+BATCH_SIZE = 1000
+
+
+class Replay:
+    """
+    Step forward and back through the board states of a game.
+
+    Starts before the first move; `board` is the board after `index` moves.
+    """
+
+    __slots__ = ("_board", "game_id", "index", "moves")
+
+    def __init__(self, game_id: int, moves: list[tuple[int, Player]]):
+        """
+        Create a replay positioned before the first move.
+
+        Args:
+            game_id: Game ID
+            moves: (position, player) pairs in move order
+        """
+        self.game_id = game_id
+        self.moves = moves
+        self.index = 0
+        self._board = list(EMPTY_BOARD)
+
+    @classmethod
+    def from_state(cls, state: GameState) -> Replay:
+        """
+        Build a replay from a GameState's move list.
+
+        Args:
+            state: Game state
+
+        Returns:
+            Replay of the game's moves
+        """
+        moves = [(position, Player(state.board[position])) for position in state.moves]
+        return cls(state.game_id, moves)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    @property
+    def board(self) -> str:
+        """Board state after the current move."""
+        return "".join(self._board)
+
+    def step_forward(self) -> bool:
+        """
+        Apply the next move.
+
+        Returns:
+            True if a move was applied, False if already at the end
+        """
+        if self.index == len(self.moves):
+            return False
+        position, player = self.moves[self.index]
+        self._board[position] = player.value
+        self.index += 1
+        return True
+
+    def step_back(self) -> bool:
+        """
+        Undo the current move.
+
+        Returns:
+            True if a move was undone, False if already at the start
+        """
+        if self.index == 0:
+            return False
+        self.index -= 1
+        position, _ = self.moves[self.index]
+        self._board[position] = "-"
+        return True
+
+    def seek(self, index: int) -> None:
+        """
+        Jump to the board after `index` moves.
+
+        Args:
+            index: Number of moves to have applied (clamped to the game)
+        """
+        index = max(0, min(index, len(self.moves)))
+        while self.index < index:
+            self.step_forward()
+        while self.index > index:
+            self.step_back()
+
+    def boards(self) -> Iterator[str]:
+        """Yield every board state from the empty board to the final one."""
+        self.seek(0)
+        yield self.board
+        while self.step_forward():
+            yield self.board
+
+
+def load_game_with_moves(db: Session, game_id: int) -> Game | None:
+    """
+    Load a game and its ordered moves in a single query.
+
+    Args:
+        db: Database session
+        game_id: Game ID to load
+
+    Returns:
+        Game instance with `moves` loaded, or None if not found
+    """
+    return (
+        db.scalars(
+            select(Game).options(joinedload(Game.moves)).where(Game.id == game_id)
+        )
+        .unique()
+        .first()
+    )
+
+
+def _replay_rows(db: Session, game_ids: list[int]):
+    """One row per move (or per game without moves), ordered by game and move."""
+    return db.execute(
+        select(Game.id, Move.position, Move.player)
+        .outerjoin(Move, Move.game_id == Game.id)
+        .where(Game.id.in_(game_ids))
+        .order_by(Game.id, Move.move_number)
+    )
+
+
+def load_replays(db: Session, game_ids: Iterable[int]) -> dict[int, Replay]:
+    """
+    Load replays for many games with one column-only query per batch.
+
+    Args:
+        db: Database session
+        game_ids: Game IDs to load
+
+    Returns:
+        Mapping of game ID to Replay; IDs that do not exist are left out
+    """
+    replays = {}
+    for batch in itertools.batched(game_ids, BATCH_SIZE, strict=False):
+        rows = _replay_rows(db, list(batch))
+        for game_id, group in itertools.groupby(rows, key=lambda row: row[0]):
+            moves = [
+                (position, player)
+                for _, position, player in group
+                if position is not None
+            ]
+            replays[game_id] = Replay(game_id, moves)
+    return replays
+
+
+def load_replay(db: Session, game_id: int) -> Replay | None:
+    """
+    Load the replay of one game in a single query.
+
+    Args:
+        db: Database session
+        game_id: Game ID to load
+
+    Returns:
+        Replay, or None if the game does not exist
+    """
+    return load_replays(db, [game_id]).get(game_id)
+
+
+def export_games(db: Session, out: TextIO) -> int:
+    """
+    Write every game's history as one JSON object per line.
+
+    Histories are loaded with `load_replays`, one query per batch of
+    BATCH_SIZE games, rather than one query per game.
+
+    Args:
+        db: Database session
+        out: Text stream to write to
+
+    Returns:
+        Number of games written
+    """
+    game_ids = db.scalars(select(Game.id).order_by(Game.id)).all()
+    count = 0
+    for batch in itertools.batched(game_ids, BATCH_SIZE, strict=False):
+        for game_id, replay in load_replays(db, batch).items():
+            replay.seek(len(replay))
+            record = {
+                "game_id": game_id,
+                "moves": [
+                    [position, player.value] for position, player in replay.moves
+                ],
+                "board": replay.board,
+            }
+            out.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+
+def main() -> None:
+    """Run the `export` command given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="export games as JSON lines")
+    export_cmd.add_argument("path")
+
+    args = parser.parse_args()
+    with router.read_session() as db, open(args.path, "w") as out:
+        count = export_games(db, out)
+    print(f"Exported {count} games to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,15 @@
 import enum
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db import Base
@@ -40,6 +48,8 @@ class Game(Base):
     """
 
     __tablename__ = "games"
+    # Keyset pagination of listings, newest first (see fastpath.list_page).
+    __table_args__ = (Index("ix_games_created_at_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     board_state: Mapped[str] = mapped_column(String(9), default="---------")
@@ -58,7 +68,9 @@ class Game(Base):
     )
 
     moves: Mapped[list[Move]] = relationship(
-        back_populates="game", cascade="all, delete-orphan"
+        back_populates="game",
+        cascade="all, delete-orphan",
+        order_by="Move.move_number",
     )
 
 
@@ -84,3 +96,33 @@ class Move(Base):
     )
 
     game: Mapped[Game] = relationship(back_populates="moves")
+
+
+class TournamentGame(Base):
+    """
+    Result of one game played between two strategies in a tournament.
+
+    Each game is identified by (tournament, x_strategy, o_strategy, round),
+    which lets an interrupted tournament resume by skipping stored games.
+    game_id links to the full game and its moves, or is NULL when the
+    tournament was run in results-only mode.
+    """
+
+    __tablename__ = "tournament_games"
+    __table_args__ = (
+        UniqueConstraint("tournament", "x_strategy", "o_strategy", "round"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    tournament: Mapped[str] = mapped_column(String(100), index=True)
+    x_strategy: Mapped[str] = mapped_column(String(50))
+    o_strategy: Mapped[str] = mapped_column(String(50))
+    round: Mapped[int] = mapped_column(Integer)
+    status: Mapped[GameStatus] = mapped_column(Enum(GameStatus))
+    winner: Mapped[Player | None] = mapped_column(Enum(Player), nullable=True)
+    game_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("games.id"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
@@ -0,0 +1,264 @@
+"""Fast move generation on a mutable bitboard.
+
+`Board` keeps one bitmask per player (bit i = position i), plays moves in
+place with `make`/`unmake` on an undo stack and maintains a Zobrist hash
+incrementally, so search and simulation never allocate a board per move.
+Boards are `size` x `size` with `size` in a row needed to win; size 3 is
+the regular game and matches the `game_logic` string format.
+"""
+
+import random
+from collections.abc import Iterator
+from functools import cache
+from typing import NamedTuple
+
+from game_logic import check_winner, get_next_player, is_valid_move, make_move
+from models import Player
+
+X, O = 0, 1  # noqa: E741
+_MARKS = "xo"
+_ZOBRIST_SEED = 0x7A0B
+
+
+class Geometry(NamedTuple):
+    """Precomputed masks and hash keys for one board size."""
+
+    cells: int
+    full: int
+    lines: tuple[int, ...]
+    lines_through: tuple[tuple[int, ...], ...]
+    zobrist: tuple[tuple[int, int], ...]
+    side_key: int
+
+
+@cache
+def geometry(size: int) -> Geometry:
+    """
+    Build the winning lines and Zobrist keys for a board size.
+
+    Args:
+        size: Board side length
+
+    Returns:
+        Geometry for `size` x `size` boards
+    """
+    cells = size * size
+    rows = [[r * size + c for c in range(size)] for r in range(size)]
+    columns = [[r * size + c for r in range(size)] for c in range(size)]
+    diagonals = [
+        [i * size + i for i in range(size)],
+        [i * size + size - 1 - i for i in range(size)],
+    ]
+    lines = tuple(sum(1 << i for i in line) for line in rows + columns + diagonals)
+    lines_through = tuple(
+        tuple(line for line in lines if line >> cell & 1) for cell in range(cells)
+    )
+
+    rng = random.Random(_ZOBRIST_SEED + size)
+    zobrist = tuple((rng.getrandbits(64), rng.getrandbits(64)) for _ in range(cells))
+    return Geometry(
+        cells, (1 << cells) - 1, lines, lines_through, zobrist, rng.getrandbits(64)
+    )
+
+
+def iter_moves(mask: int) -> Iterator[int]:
+    """
+    Iterate the positions set in a move bitmask, lowest first.
+
+    Args:
+        mask: Bitmask of positions
+
+    Yields:
+        Positions
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Board:
+    """Mutable bitboard with an undo stack and an incremental Zobrist hash."""
+
+    __slots__ = ("_geometry", "_stack", "bits", "hash", "side", "size")
+
+    def __init__(self, size: int = 3):
+        self.size = size
+        self._geometry = geometry(size)
+        self.bits = [0, 0]
+        self.side = X
+        self.hash = 0
+        self._stack: list[int] = []
+
+    @classmethod
+    def from_string(cls, board_state: str) -> Board:
+        """
+        Build a board from a `game_logic` board string (X moves first).
+
+        Args:
+            board_state: Board string of `size`**2 characters
+
+        Returns:
+            Board with the same marks and side to move; the undo stack is
+            empty, so the position cannot be unmade past this point
+        """
+        board = cls(round(len(board_state) ** 0.5))
+        for position, mark in enumerate(board_state):
+            if mark != "-":
+                side = _MARKS.index(mark)
+                board.bits[side] |= 1 << position
+                board.hash ^= board._geometry.zobrist[position][side]
+        if board.bits[X].bit_count() > board.bits[O].bit_count():
+            board.side = O
+            board.hash ^= board._geometry.side_key
+        return board
+
+    def to_string(self) -> str:
+        """Get the `game_logic` board string."""
+        x_bits, o_bits = self.bits
+        return "".join(
+            "x" if x_bits >> i & 1 else "o" if o_bits >> i & 1 else "-"
+            for i in range(self._geometry.cells)
+        )
+
+    @property
+    def player(self) -> Player:
+        """Player to move."""
+        return Player.X if self.side == X else Player.O
+
+    @property
+    def last_move(self) -> int | None:
+        """Position of the last move made with `make`, if any."""
+        return self._stack[-1] if self._stack else None
+
+    def legal_moves(self) -> int:
+        """Bitmask of empty positions."""
+        return self._geometry.full & ~(self.bits[X] | self.bits[O])
+
+    def make(self, position: int) -> None:
+        """
+        Play `position` for the side to move.
+
+        Args:
+            position: Empty position (not validated)
+        """
+        keys = self._geometry.zobrist[position]
+        self.bits[self.side] |= 1 << position
+        self.hash ^= keys[self.side] ^ self._geometry.side_key
+        self.side ^= 1
+        self._stack.append(position)
+
+    def unmake(self) -> None:
+        """Take back the last move made with `make`."""
+        position = self._stack.pop()
+        self.side ^= 1
+        self.bits[self.side] &= ~(1 << position)
+        self.hash ^= (
+            self._geometry.zobrist[position][self.side] ^ self._geometry.side_key
+        )
+
+    def is_won(self) -> bool:
+        """Whether the last move completed a line (only its lines are checked)."""
+        if not self._stack:
+            return any(
+                line & bits == line
+                for bits in self.bits
+                for line in self._geometry.lines
+            )
+        bits = self.bits[self.side ^ 1]
+        for line in self._geometry.lines_through[self._stack[-1]]:
+            if line & bits == line:
+                return True
+        return False
+
+    def winning_moves(self, side: int | None = None) -> int:
+        """
+        Bitmask of positions that complete a line for `side`.
+
+        Args:
+            side: X or O (default: side to move)
+
+        Returns:
+            Bitmask of winning positions
+        """
+        if side is None:
+            side = self.side
+        own, other = self.bits[side], self.bits[side ^ 1]
+        needed = self.size - 1
+        mask = 0
+        for line in self._geometry.lines:
+            if not line & other and (line & own).bit_count() == needed:
+                mask |= line & ~own
+        return mask
+
+    def blocking_moves(self) -> int:
+        """Bitmask of positions the side to move must take to stop a win."""
+        return self.winning_moves(self.side ^ 1)
+
+    def threats_from_last_move(self) -> int:
+        """
+        Bitmask of positions where the last move created a win threat.
+
+        Only the lines through the last move are checked, so this is the
+        cheap incremental version of `blocking_moves` for the side to move.
+        """
+        if not self._stack:
+            return 0
+        mover = self.side ^ 1
+        own, other = self.bits[mover], self.bits[self.side]
+        needed = self.size - 1
+        mask = 0
+        for line in self._geometry.lines_through[self._stack[-1]]:
+            if not line & other and (line & own).bit_count() == needed:
+                mask |= line & ~own
+        return mask
+
+
+def perft(board: Board, depth: int) -> int:
+    """
+    Count the leaf nodes of the game tree to `depth` plies.
+
+    Won positions are leaves, as are full boards.
+
+    Args:
+        board: Board to search (restored before returning)
+        depth: Plies to search
+
+    Returns:
+        Number of leaf nodes
+    """
+    if depth == 0 or board.is_won():
+        return 1
+    moves = board.legal_moves()
+    if not moves:
+        return 1
+    nodes = 0
+    for position in iter_moves(moves):
+        board.make(position)
+        nodes += perft(board, depth - 1)
+        board.unmake()
+    return nodes
+
+
+def perft_string(board_state: str, player: Player, depth: int) -> int:
+    """
+    `perft` over the `game_logic` string API, for comparison.
+
+    Args:
+        board_state: Board string
+        player: Player to move
+        depth: Plies to search
+
+    Returns:
+        Number of leaf nodes
+    """
+    if depth == 0 or check_winner(board_state):
+        return 1
+    moves = [p for p in range(9) if is_valid_move(board_state, p)]
+    if not moves:
+        return 1
+    opponent = get_next_player(player)
+    return sum(
+        perft_string(make_move(board_state, position, player), opponent, depth - 1)
+        for position in moves
+    )
@@ -0,0 +1,195 @@
+"""Game persistence backends used by the CLI."""
+
+import os
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import replace
+from typing import Protocol
+
+from sqlalchemy.orm import Session
+
+import fastpath
+from db import SessionRouter, init_db, router
+from event_log import EventLogStore
+from game_state import GameState
+from models import Game
+
+
+class GameStore(Protocol):
+    """Interface the CLI uses to create, save and load games."""
+
+    def new_game(self) -> GameState:
+        """Create and persist a new game."""
+        ...
+
+    def save_move(self, state: GameState) -> None:
+        """Persist the latest move of `state` and the resulting game state."""
+        ...
+
+    def load_game(self, game_id: int, for_write: bool = False) -> GameState | None:
+        """
+        Load a game by ID, or None if it does not exist.
+
+        Pass `for_write=True` when moves will be saved on top of the
+        result (resuming play), so it is never a stale copy.
+        """
+        ...
+
+    def list_games(self) -> list[GameState]:
+        """List all games, newest first (`moves` may be left empty)."""
+        ...
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether plain loads may return a copy that lags behind writes."""
+        ...
+
+    def flush(self) -> None:
+        """Make every move saved so far durable."""
+        ...
+
+    def close(self) -> None:
+        """Release resources and make pending writes durable."""
+        ...
+
+
+class SqlGameStore:
+    """
+    GameStore backed by the `games`/`moves` tables.
+
+    Moves, loads and listings go through the Core statements in `fastpath`.
+    Writes, and loads for writing, go through `db`. With a `router`, other
+    loads and listings use read sessions from it (read replicas, with
+    read-your-writes for games saved through this store); without one
+    they also use `db`.
+    """
+
+    def __init__(self, db: Session, router: SessionRouter | None = None):
+        self.db = db
+        self.router = router
+
+    def read_session(
+        self, game_id: int | None = None
+    ) -> AbstractContextManager[Session]:
+        """
+        Get a session for reads (see `SessionRouter.read_session`).
+
+        Args:
+            game_id: Game about to be read, or None for listings/analytics
+
+        Returns:
+            Context manager yielding the session
+        """
+        if self.router is None:
+            return nullcontext(self.db)
+        return self.router.read_session(game_id)
+
+    def new_game(self) -> GameState:
+        """
+        Create and persist a new game.
+
+        Returns:
+            State of the new game
+        """
+        game = Game()
+        self.db.add(game)
+        self.db.commit()
+        self.db.refresh(game)
+        self._mark_written(game.id)
+        return GameState(game_id=game.id, created_at=game.created_at)
+
+    def save_move(self, state: GameState) -> None:
+        """
+        Persist the latest move of a game state in one commit.
+
+        Args:
+            state: Game state after the move
+        """
+        fastpath.save_move(self.db, state)
+        self._mark_written(state.game_id)
+
+    def _mark_written(self, game_id: int) -> None:
+        """Record a write with the router for read-your-writes."""
+        if self.router is not None:
+            self.router.mark_written(game_id)
+
+    def load_game(self, game_id: int, for_write: bool = False) -> GameState | None:
+        """
+        Load a game and its moves.
+
+        Args:
+            game_id: Game ID to load
+            for_write: Read from the write database, for resuming play
+
+        Returns:
+            GameState, or None if not found
+        """
+        if for_write:
+            return fastpath.load_game(self.db, game_id)
+        with self.read_session(game_id) as db:
+            return fastpath.load_game(db, game_id)
+
+    def list_games(self) -> list[GameState]:
+        """
+        List all games, without their moves.
+
+        With read replicas, games saved through this store within the
+        replica lag window are read from the write database and overlaid
+        on the replica listing.
+
+        Returns:
+            List of GameStates, newest first
+        """
+        games: list[GameState] = []
+        with self.read_session() as db:
+            after = None
+            while True:
+                page = fastpath.list_page(db, after=after)
+                games.extend(page)
+                if len(page) < fastpath.PAGE_SIZE:
+                    break
+                after = fastpath.page_key(page[-1])
+
+        if not self.has_replicas:
+            return games
+        recent = self.router.recent_writes()
+        if not recent:
+            return games
+        by_id = {state.game_id: state for state in games}
+        for game_id in recent:
+            state = fastpath.load_game(self.db, game_id)
+            if state is not None:
+                by_id[game_id] = replace(state, moves=())
+        return sorted(
+            by_id.values(),
+            key=lambda state: (state.created_at, state.game_id),
+            reverse=True,
+        )
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether reads are routed to read replicas."""
+        return self.router is not None and self.router.has_replicas
+
+    def flush(self) -> None:
+        """Nothing to do: every move is committed as it is saved."""
+
+    def close(self) -> None:
+        """Close the write session."""
+        self.db.close()
+
+
+def open_store() -> GameStore:
+    """
+    Open the backend selected by the GAME_STORE environment variable.
+
+    GAME_STORE=eventlog uses the append-only log at EVENT_LOG_PATH
+    (default games.log); anything else uses the database.
+
+    Returns:
+        Open GameStore
+    """
+    if os.getenv("GAME_STORE") == "eventlog":
+        return EventLogStore(os.getenv("EVENT_LOG_PATH", "games.log"))
+
+    init_db()
+    return SqlGameStore(router.write_session(), router)
@@ -0,0 +1,139 @@
+"""Computer players for tic-tac-toe."""
+
+import os
+import random
+from collections.abc import Callable
+from functools import cache
+
+from game_logic import check_winner, get_next_player, is_valid_move, make_move
+from models import Player
+from tablebase import Entry, Tablebase, solve
+
+# A strategy picks a position for `player` on a board that still has moves.
+Strategy = Callable[[str, Player, random.Random], int]
+
+SEARCH_DEPTH = 2
+
+_LINES = [
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+]
+
+
+def legal_moves(board_state: str) -> list[int]:
+    """
+    Get all empty positions.
+
+    Args:
+        board_state: Current board state
+
+    Returns:
+        Empty positions in ascending order
+    """
+    return [position for position in range(9) if is_valid_move(board_state, position)]
+
+
+def winning_moves(board_state: str, player: Player) -> list[int]:
+    """
+    Get the positions where `player` would win immediately.
+
+    Args:
+        board_state: Current board state
+        player: Player to check for
+
+    Returns:
+        Winning positions in ascending order
+    """
+    return [
+        position
+        for position in legal_moves(board_state)
+        if check_winner(make_move(board_state, position, player)) == player
+    ]
+
+
+def random_move(board_state: str, player: Player, rng: random.Random) -> int:
+    """Play any empty position."""
+    return rng.choice(legal_moves(board_state))
+
+
+def greedy_move(board_state: str, player: Player, rng: random.Random) -> int:
+    """Win if possible, otherwise block, otherwise prefer center, corners, edges."""
+    for candidates in (
+        winning_moves(board_state, player),
+        winning_moves(board_state, get_next_player(player)),
+        [p for p in [4] if is_valid_move(board_state, p)],
+        [p for p in [0, 2, 6, 8] if is_valid_move(board_state, p)],
+    ):
+        if candidates:
+            return rng.choice(candidates)
+    return random_move(board_state, player, rng)
+
+
+@cache
+def _solved_lookup() -> Callable[[str], Entry | None]:
+    """Use the tablebase file at TABLEBASE_PATH if set, else solve in memory."""
+    path = os.getenv("TABLEBASE_PATH")
+    if path:
+        return Tablebase(path).lookup
+    return solve().get
+
+
+def solver_move(board_state: str, player: Player, rng: random.Random) -> int:
+    """Play a game-theoretically best move (perfect play)."""
+    return rng.choice(_solved_lookup()(board_state).best_moves)
+
+
+def _evaluate(board_state: str, player: Player) -> int:
+    """Heuristic score: lines still open to `player` minus those open to the opponent."""
+    opponent = get_next_player(player).value
+    score = 0
+    for line in _LINES:
+        cells = {board_state[i] for i in line}
+        if opponent not in cells:
+            score += 1
+        if player.value not in cells:
+            score -= 1
+    return score
+
+
+def _negamax(board_state: str, player: Player, depth: int) -> int:
+    """Depth-limited negamax score of `board_state` for `player` to move."""
+    if check_winner(board_state):
+        return -100 - depth
+    moves = legal_moves(board_state)
+    if not moves:
+        return 0
+    if depth == 0:
+        return _evaluate(board_state, player)
+    opponent = get_next_player(player)
+    return max(
+        -_negamax(make_move(board_state, position, player), opponent, depth - 1)
+        for position in moves
+    )
+
+
+def search_move(board_state: str, player: Player, rng: random.Random) -> int:
+    """Play the best move of a shallow heuristic search (SEARCH_DEPTH plies)."""
+    opponent = get_next_player(player)
+    scores = {
+        position: -_negamax(
+            make_move(board_state, position, player), opponent, SEARCH_DEPTH - 1
+        )
+        for position in legal_moves(board_state)
+    }
+    best = max(scores.values())
+    return rng.choice([p for p, score in scores.items() if score == best])
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "random": random_move,
+    "greedy": greedy_move,
+    "solver": solver_move,
+    "search": search_move,
+}
@@ -0,0 +1,278 @@
+"""Solved-position tablebase stored in a memory-mapped binary file.
+
+File layout (little-endian):
+
+    header  magic "TTTB", format version, board cells, record size,
+            reserved, slot count                     (HEADER, 16 bytes)
+    records one RECORD per slot, slot = base-3 rank of the board
+
+The base-3 rank ('-' = 0, 'x' = 1, 'o' = 2, position 0 least significant)
+is a perfect hash: every board maps to its own slot, so a lookup is a
+single offset computation with no probing. Slots for unreachable boards
+hold UNREACHABLE.
+
+Each record stores, from the point of view of the player to move:
+
+    value     1 = win, 0 = draw, -1 = loss (UNREACHABLE if not reachable)
+    distance  plies to the end of the game under optimal play
+    best      bitmask of positions that achieve value/distance
+
+Generate once, then open read-only in any number of processes; the OS
+shares the mapped pages between them.
+
+    uv run python tablebase.py generate tablebase.bin
+    uv run python tablebase.py lookup tablebase.bin x---o----
+"""
+
+import argparse
+import mmap
+import re
+import struct
+from typing import NamedTuple
+
+from game_logic import check_draw, check_winner, is_valid_move, make_move
+from models import Player
+
+MAGIC = b"TTTB"
+FORMAT_VERSION = 1
+CELLS = 9
+HEADER = struct.Struct("<4sHHHHI")
+RECORD = struct.Struct("<bBH")
+UNREACHABLE = -128
+SLOTS = 3**CELLS
+
+_BASE3_DIGITS = str.maketrans("-xo", "012")
+_VALID_BOARD = re.compile(f"[-xo]{{{CELLS}}}")
+
+
+class TablebaseError(Exception):
+    """Raised when a tablebase file is missing, corrupt or incompatible."""
+
+
+class Entry(NamedTuple):
+    """Solved value of a position, from the point of view of the player to move."""
+
+    value: int
+    distance: int
+    best: int
+
+    @property
+    def best_moves(self) -> list[int]:
+        """Positions that achieve the solved value, in ascending order."""
+        return [position for position in range(CELLS) if self.best >> position & 1]
+
+
+def board_index(board_state: str) -> int:
+    """
+    Perfect hash of a board: its base-3 rank.
+
+    Args:
+        board_state: 9-character board string
+
+    Returns:
+        Slot index in [0, 3**9)
+
+    Raises:
+        ValueError: If the board is not 9 characters of '-', 'x' and 'o'
+    """
+    if not _VALID_BOARD.fullmatch(board_state):
+        raise ValueError(f"invalid board {board_state!r}: expected 9 of '-', 'x', 'o'")
+    return int(board_state[::-1].translate(_BASE3_DIGITS), 3)
+
+
+def player_to_move(board_state: str) -> Player:
+    """
+    Get the player to move on a board, assuming X moves first.
+
+    Args:
+        board_state: Current board state
+
+    Returns:
+        Player to move
+    """
+    return Player.X if board_state.count("x") == board_state.count("o") else Player.O
+
+
+def _better(candidate: tuple[int, int], best: tuple[int, int]) -> bool:
+    """Compare (value, distance): prefer higher value, quick wins, slow losses."""
+    if candidate[0] != best[0]:
+        return candidate[0] > best[0]
+    if candidate[0] > 0:
+        return candidate[1] < best[1]
+    return candidate[1] > best[1]
+
+
+def solve() -> dict[str, Entry]:
+    """
+    Solve every position reachable from the empty board.
+
+    Returns:
+        Mapping of board string to its Entry
+    """
+    entries: dict[str, Entry] = {}
+
+    def search(board_state: str) -> Entry:
+        if board_state in entries:
+            return entries[board_state]
+
+        if check_winner(board_state):
+            # The previous move won, so the player to move has lost.
+            entry = Entry(-1, 0, 0)
+        elif check_draw(board_state):
+            entry = Entry(0, 0, 0)
+        else:
+            player = player_to_move(board_state)
+            best = (UNREACHABLE, 0)
+            mask = 0
+            for position in range(CELLS):
+                if not is_valid_move(board_state, position):
+                    continue
+                child = search(make_move(board_state, position, player))
+                outcome = (-child.value, child.distance + 1)
+                if outcome == best:
+                    mask |= 1 << position
+                elif _better(outcome, best):
+                    best, mask = outcome, 1 << position
+            entry = Entry(best[0], best[1], mask)
+
+        entries[board_state] = entry
+        return entry
+
+    search("-" * CELLS)
+    return entries
+
+
+def generate(path: str) -> int:
+    """
+    Solve all reachable positions and write them as a tablebase file.
+
+    Args:
+        path: Output file path
+
+    Returns:
+        Number of reachable positions written
+    """
+    entries = solve()
+    data = bytearray(HEADER.size + SLOTS * RECORD.size)
+    HEADER.pack_into(data, 0, MAGIC, FORMAT_VERSION, CELLS, RECORD.size, 0, SLOTS)
+
+    unreachable = RECORD.pack(UNREACHABLE, 0, 0)
+    data[HEADER.size :] = unreachable * SLOTS
+    for board_state, entry in entries.items():
+        offset = HEADER.size + board_index(board_state) * RECORD.size
+        RECORD.pack_into(data, offset, *entry)
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(entries)
+
+
+class Tablebase:
+    """
+    Read-only, memory-mapped view of a tablebase file.
+
+    Lookups unpack records directly from the mapping, so no per-process
+    copy of the table is built.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open and validate a tablebase file.
+
+        Args:
+            path: Tablebase file written by `generate`
+
+        Raises:
+            TablebaseError: If the file is missing, unreadable, empty, corrupt
+                or from an incompatible format version
+        """
+        try:
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            # mmap raises ValueError for an empty file.
+            raise TablebaseError(f"{path}: cannot open tablebase: {e}") from e
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise TablebaseError(f"{path}: file too small for a tablebase header")
+
+        magic, version, cells, record_size, _, slots = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise TablebaseError(f"{path}: not a tablebase file")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise TablebaseError(f"{path}: unsupported format version {version}")
+        if (cells, record_size, slots) != (CELLS, RECORD.size, SLOTS):
+            self.close()
+            raise TablebaseError(f"{path}: incompatible board size or record layout")
+        if len(self._mmap) != HEADER.size + slots * record_size:
+            self.close()
+            raise TablebaseError(f"{path}: truncated tablebase")
+
+    def lookup(self, board_state: str) -> Entry | None:
+        """
+        Look up the solved value of a board.
+
+        Args:
+            board_state: 9-character board string
+
+        Returns:
+            Entry for the player to move, or None if the board is unreachable
+
+        Raises:
+            ValueError: If the board string is malformed
+        """
+        offset = HEADER.size + board_index(board_state) * RECORD.size
+        value, distance, best = RECORD.unpack_from(self._mmap, offset)
+        if value == UNREACHABLE:
+            return None
+        return Entry(value, distance, best)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main() -> None:
+    """Run the `generate` or `lookup` command given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_cmd = commands.add_parser("generate", help="solve and write a tablebase")
+    generate_cmd.add_argument("path")
+
+    lookup_cmd = commands.add_parser("lookup", help="look up a board")
+    lookup_cmd.add_argument("path")
+    lookup_cmd.add_argument("board", help="9-character board, e.g. x---o----")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        count = generate(args.path)
+        print(f"Wrote {count} reachable positions to {args.path}")
+    else:
+        with Tablebase(args.path) as tablebase:
+            try:
+                entry = tablebase.lookup(args.board)
+            except ValueError as e:
+                parser.error(str(e))
+        if entry is None:
+            print("Unreachable position")
+        else:
+            result = {1: "win", 0: "draw", -1: "loss"}[entry.value]
+            player = player_to_move(args.board).value.upper()
+            print(
+                f"{player} to move: {result} in {entry.distance} plies, "
+                f"best moves {entry.best_moves}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Test script for move-history analytics."""
+
+import math
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from analytics import compute_move_stats
+from db import Base
+from game_logic import apply_move
+from game_state import GameState
+from models import Game, Move, Player
+
+
+def add_game(db: Session, positions: list[int]) -> None:
+    """Store a game played through the given positions."""
+    state = GameState()
+    for position in positions:
+        state = apply_move(state, position)
+
+    game = Game(
+        board_state=state.board,
+        current_player=state.current_player,
+        status=state.status,
+        winner=state.winner,
+    )
+    game.moves = [
+        Move(
+            player=Player(state.board[position]),
+            position=position,
+            move_number=number,
+        )
+        for number, position in enumerate(state.moves, start=1)
+    ]
+    db.add(game)
+
+
+def test_compute_move_stats():
+    """Test aggregation across chunks of stored moves."""
+    print("Testing compute_move_stats()...")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        add_game(db, [4, 0, 2, 8, 6])  # X wins after opening in the center
+        add_game(db, [4, 0, 2, 6, 3, 5, 1, 7, 8])  # draw after center opening
+        add_game(db, [0, 4, 1])  # corner opening, still in progress
+        db.commit()
+
+        # A chunk size smaller than the data exercises the running totals.
+        stats = compute_move_stats(db, chunk_size=4)
+
+    assert stats.total_moves == 17
+    assert stats.position_by_move[0].tolist() == [1, 0, 0, 0, 2, 0, 0, 0, 0]
+    assert stats.position_by_player.sum(axis=1).tolist() == [10, 7]
+
+    assert stats.finished_by_opening[4] == 2
+    assert stats.finished_by_opening[0] == 0
+    assert stats.win_rate_by_opening(Player.X)[4] == 0.5
+    assert stats.win_rate_by_opening(Player.O)[4] == 0.0
+    assert math.isnan(stats.win_rate_by_opening(Player.X)[0])
+    assert stats.average_length_by_opening()[4] == 7.0
+
+    engine.dispose()
+    print("✓ compute_move_stats() passed")
+
+
+if __name__ == "__main__":
+    test_compute_move_stats()
+    print("\n✓ All tests passed!")
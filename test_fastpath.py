@@ -0,0 +1,102 @@
+"""Test script for the Core fast path."""
+
+from dataclasses import replace
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+import fastpath
+from bench_fastpath import orm_load_game, orm_save_move
+from db import Base
+from game_logic import apply_move
+from game_state import GameState
+from models import Game, Move
+
+GAMES = [[4, 0, 2, 8, 6], [4, 0, 2, 6, 3, 5, 1, 7, 8], [0, 4]]
+
+
+def play_all(save_move) -> Session:
+    """Play GAMES into a fresh database through `save_move`."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    for positions in GAMES:
+        game = Game()
+        db.add(game)
+        db.commit()
+        state = GameState(game_id=game.id)
+        for position in positions:
+            state = apply_move(state, position)
+            save_move(db, state)
+    return db
+
+
+def snapshot(db: Session) -> tuple[list, list]:
+    """Rows of both tables without timestamps."""
+    game_rows = db.execute(
+        select(
+            Game.id, Game.board_state, Game.current_player, Game.status, Game.winner
+        ).order_by(Game.id)
+    ).all()
+    move_rows = db.execute(
+        select(
+            Move.id, Move.game_id, Move.player, Move.position, Move.move_number
+        ).order_by(Move.id)
+    ).all()
+    return game_rows, move_rows
+
+
+def test_same_rows_as_orm():
+    """Test the fast path writes exactly the rows the ORM path writes."""
+    print("Testing fastpath.save_move() against the ORM path...")
+    orm_db = play_all(orm_save_move)
+    core_db = play_all(fastpath.save_move)
+    assert snapshot(core_db) == snapshot(orm_db)
+    assert all(game.updated_at for game in core_db.scalars(select(Game)))
+    orm_db.close()
+    core_db.close()
+    print("✓ fastpath.save_move() passed")
+
+
+def test_returning():
+    """Test RETURNING values of the write statements."""
+    print("\nTesting RETURNING...")
+    db = play_all(fastpath.save_move)
+    state = apply_move(fastpath.load_game(db, 3), 8)
+    move_id = fastpath.insert_move(db, state)
+    assert move_id == db.scalar(select(Move.id).order_by(Move.id.desc()))
+    assert fastpath.update_game(db, state) is not None
+    db.close()
+    print("✓ RETURNING passed")
+
+
+def test_loads_match_orm():
+    """Test the fast path loads the same game states as the ORM path."""
+    print("\nTesting fastpath.load_game() and list_page()...")
+    db = play_all(fastpath.save_move)
+    for game_id in (1, 2, 3):
+        assert fastpath.load_game(db, game_id) == orm_load_game(db, game_id)
+    assert fastpath.load_game(db, 999) is None
+
+    # Listings carry the game columns only.
+    newest_first = [
+        replace(fastpath.load_game(db, game_id), moves=()) for game_id in (3, 2, 1)
+    ]
+    assert fastpath.list_page(db) == newest_first
+
+    # Keyset paging: a game created between pages does not shift the next one.
+    first_page = fastpath.list_page(db, limit=2)
+    assert first_page == newest_first[:2]
+    db.add(Game())
+    db.commit()
+    after = fastpath.page_key(first_page[-1])
+    assert fastpath.list_page(db, limit=2, after=after) == newest_first[2:]
+    db.close()
+    print("✓ fastpath.load_game() and list_page() passed")
+
+
+if __name__ == "__main__":
+    test_same_rows_as_orm()
+    test_returning()
+    test_loads_match_orm()
+    print("\n✓ All tests passed!")
@@ -1,6 +1,7 @@
 """Test script for game logic functions."""
 
 from game_logic import (
+    apply_move,
     check_draw,
     check_winner,
     get_move_count,
@@ -8,7 +9,8 @@ from game_logic import (
     is_valid_move,
     make_move,
 )
-from models import Player
+from game_state import GameState
+from models import GameStatus, Player
 
 
 def test_is_valid_move():
@@ -147,6 +149,29 @@ def test_game_scenario():
     print("✓ Game scenario passed - X wins!")
 
 
+def test_apply_move():
+    """Test applying moves to an in-memory game state."""
+    print("\nTesting apply_move()...")
+    state = GameState(game_id=1)
+
+    state = apply_move(state, 4)
+    assert state.board == "----x----"
+    assert state.current_player == Player.O
+    assert state.moves == (4,)
+    assert state.move_count == 1
+
+    for position in [0, 1, 8, 7]:
+        state = apply_move(state, position)
+
+    assert state.board == "ox--x--xo"
+    assert state.status == GameStatus.COMPLETED
+    assert state.winner == Player.X
+    assert state.current_player == Player.X
+    assert state.moves == (4, 0, 1, 8, 7)
+    assert state.game_id == 1
+    print("✓ apply_move() passed")
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("Running Game Logic Tests")
@@ -159,6 +184,7 @@ if __name__ == "__main__":
     test_get_next_player()
     test_get_move_count()
     test_game_scenario()
+    test_apply_move()
 
     print("\n" + "=" * 50)
     print("✓ All tests passed!")
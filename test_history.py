@@ -0,0 +1,138 @@
+"""Test script for game history loading and replay."""
+
+import io
+import json
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from db import Base
+from game_logic import apply_move
+from game_state import GameState
+from history import (
+    Replay,
+    export_games,
+    load_game_with_moves,
+    load_replay,
+    load_replays,
+)
+from models import Game, Move, Player
+
+
+def add_game(db: Session, positions: list[int]) -> int:
+    """Store a game played through the given positions, moves out of order."""
+    state = GameState()
+    for position in positions:
+        state = apply_move(state, position)
+
+    game = Game(board_state=state.board, status=state.status, winner=state.winner)
+    game.moves = [
+        Move(player=Player(state.board[position]), position=position, move_number=n)
+        for n, position in reversed(list(enumerate(state.moves, start=1)))
+    ]
+    db.add(game)
+    db.commit()
+    return game.id
+
+
+def count_queries(engine) -> list[str]:
+    """Record the SQL statements executed on `engine`."""
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_replay_steps():
+    """Test stepping forward and back through a replay."""
+    print("Testing Replay...")
+    replay = Replay.from_state(apply_move(apply_move(GameState(), 4), 0))
+    assert len(replay) == 2
+    assert replay.board == "---------"
+    assert replay.step_back() is False
+
+    assert replay.step_forward() is True
+    assert replay.board == "----x----"
+    assert replay.step_forward() is True
+    assert replay.board == "o---x----"
+    assert replay.step_forward() is False
+
+    assert replay.step_back() is True
+    assert replay.board == "----x----"
+
+    replay.seek(99)
+    assert replay.index == 2
+    assert list(replay.boards()) == ["---------", "----x----", "o---x----"]
+    print("✓ Replay passed")
+
+
+def test_load_history():
+    """Test single-query and batched history loading."""
+    print("\nTesting history loading...")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        first = add_game(db, [4, 0, 2, 8, 6])
+        second = add_game(db, [0, 4])
+        empty = add_game(db, [])
+        db.expunge_all()
+
+        statements = count_queries(engine)
+        game = load_game_with_moves(db, first)
+        assert [move.move_number for move in game.moves] == [1, 2, 3, 4, 5]
+        assert [move.position for move in game.moves] == [4, 0, 2, 8, 6]
+        assert len(statements) == 1
+        assert load_game_with_moves(db, 999) is None
+
+        statements.clear()
+        replays = load_replays(db, [first, second, empty, 999])
+        assert len(statements) == 1
+        assert set(replays) == {first, second, empty}
+        assert replays[second].moves == [(0, Player.X), (4, Player.O)]
+        assert len(replays[empty]) == 0
+
+        replay = load_replay(db, first)
+        replay.seek(len(replay))
+        assert replay.board == "o-x-x-x-o"
+        assert load_replay(db, 999) is None
+
+    engine.dispose()
+    print("✓ history loading passed")
+
+
+def test_export_games():
+    """Test exporting game histories with batched loading."""
+    print("\nTesting export_games()...")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        first = add_game(db, [4, 0, 2, 8, 6])
+        second = add_game(db, [0, 4])
+        empty = add_game(db, [])
+
+        statements = count_queries(engine)
+        out = io.StringIO()
+        assert export_games(db, out) == 3
+        # One query for the IDs and one for the batch of histories.
+        assert len(statements) == 2
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [record["game_id"] for record in records] == [first, second, empty]
+        assert records[0]["board"] == "o-x-x-x-o"
+        assert records[1]["moves"] == [[0, "x"], [4, "o"]]
+        assert records[2] == {"game_id": empty, "moves": [], "board": "---------"}
+
+    engine.dispose()
+    print("✓ export_games() passed")
+
+
+if __name__ == "__main__":
+    test_replay_steps()
+    test_load_history()
+    test_export_games()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,94 @@
+"""Test script for the bitboard move generator."""
+
+from models import Player
+from movegen import Board, O, X, iter_moves, perft, perft_string
+
+
+def test_make_unmake():
+    """Test that unmake restores the bitboards, side to move and hash."""
+    print("Testing Board.make() and Board.unmake()...")
+    board = Board()
+    assert board.legal_moves() == 0b111111111
+    assert list(iter_moves(board.legal_moves())) == list(range(9))
+
+    board.make(4)
+    board.make(0)
+    assert board.to_string() == "o---x----"
+    assert board.player == Player.X
+    assert board.last_move == 0
+    assert list(iter_moves(board.legal_moves())) == [1, 2, 3, 5, 6, 7, 8]
+
+    board.unmake()
+    board.unmake()
+    assert board.bits == [0, 0]
+    assert board.side == X
+    assert board.hash == 0
+    assert board.last_move is None
+    print("✓ Board.make() and Board.unmake() passed")
+
+
+def test_string_round_trip_and_hash():
+    """Test string conversion and that transpositions share a hash."""
+    print("\nTesting Board.from_string() and Zobrist hashing...")
+    a = Board()
+    for position in (0, 4, 8):
+        a.make(position)
+    b = Board()
+    for position in (8, 4, 0):
+        b.make(position)
+    assert a.to_string() == b.to_string() == "x---o---x"
+    assert a.hash == b.hash
+
+    c = Board.from_string("x---o---x")
+    assert c.side == O
+    assert c.hash == a.hash
+    assert c.to_string() == "x---o---x"
+
+    b.make(1)
+    assert b.hash != a.hash
+    print("✓ Board.from_string() and Zobrist hashing passed")
+
+
+def test_winning_and_blocking_moves():
+    """Test win, block and threat detection."""
+    print("\nTesting winning/blocking move detection...")
+    board = Board()
+    for position in (0, 3, 1):
+        board.make(position)
+    # X threatens the top row; O to move must block at 2.
+    assert board.threats_from_last_move() == 1 << 2
+    assert board.blocking_moves() == 1 << 2
+    assert board.winning_moves() == 0
+
+    board.make(4)
+    # O now threatens the middle row too.
+    assert board.winning_moves() == 1 << 2
+    assert board.blocking_moves() == 1 << 5
+
+    board.make(2)
+    assert board.is_won()
+    assert Board.from_string("xxxoo----").is_won()
+    assert not Board.from_string("xx-oo----").is_won()
+    print("✓ winning/blocking move detection passed")
+
+
+def test_perft():
+    """Test node counts against the string API and known totals."""
+    print("\nTesting perft()...")
+    for depth in range(1, 5):
+        assert perft(Board(), depth) == perft_string("---------", Player.X, depth)
+    # Number of distinct complete games of tic-tac-toe.
+    assert perft(Board(), 9) == 255168
+
+    board = Board(4)
+    assert perft(board, 3) == 16 * 15 * 14
+    assert board.bits == [0, 0]
+    print("✓ perft() passed")
+
+
+if __name__ == "__main__":
+    test_make_unmake()
+    test_string_round_trip_and_hash()
+    test_winning_and_blocking_moves()
+    test_perft()
+    print("\n✓ All tests passed!")
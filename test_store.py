@@ -0,0 +1,250 @@
+"""Test script for the game store backends."""
+
+import json
+import os
+import tempfile
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from db import Base, SessionRouter
+from event_log import EVENT, HEADER, EventLogError, EventLogStore, read_events
+from game_logic import apply_move
+from models import GameStatus, Player
+from store import GameStore, SqlGameStore
+
+
+def play(store: GameStore, positions: list[int]) -> int:
+    """Create a game in `store`, play `positions` and return its ID."""
+    state = store.new_game()
+    for position in positions:
+        state = apply_move(state, position)
+        store.save_move(state)
+    return state.game_id
+
+
+def check_store(store: GameStore) -> None:
+    """Run the same save/load scenario against any store."""
+    finished = play(store, [4, 0, 2, 8, 6])
+    paused = play(store, [0, 4])
+
+    state = store.load_game(finished)
+    assert state.board == "o-x-x-x-o"
+    assert state.status == GameStatus.COMPLETED
+    assert state.winner == Player.X
+    assert state.moves == (4, 0, 2, 8, 6)
+
+    state = store.load_game(paused)
+    assert state.moves == (0, 4)
+    assert state.current_player == Player.X
+    assert state.status == GameStatus.IN_PROGRESS
+
+    assert store.load_game(999) is None
+    assert {finished, paused} <= {game.game_id for game in store.list_games()}
+
+
+def test_sql_store():
+    """Test the database-backed store."""
+    print("Testing SqlGameStore...")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    store = SqlGameStore(Session(engine))
+    check_store(store)
+    store.close()
+    engine.dispose()
+    print("✓ SqlGameStore passed")
+
+
+def test_sql_store_routing():
+    """Test read/write routing with two database files as primary and replica."""
+    print("\nTesting SqlGameStore with a SessionRouter...")
+    with tempfile.TemporaryDirectory() as tmp:
+        primary = create_engine(f"sqlite:///{os.path.join(tmp, 'primary.db')}")
+        replica = create_engine(f"sqlite:///{os.path.join(tmp, 'replica.db')}")
+        for bind in (primary, replica):
+            Base.metadata.create_all(bind)
+
+        router = SessionRouter(primary, [replica], lag_seconds=60)
+        store = SqlGameStore(router.write_session(), router)
+        game_id = play(store, [4, 0])
+
+        # Read-your-writes: the game just moved in is read from the primary,
+        # and listings (read from the empty replica) include it.
+        assert store.load_game(game_id).moves == (4, 0)
+        listed = store.list_games()
+        assert [(game.game_id, game.moves) for game in listed] == [(game_id, ())]
+        assert router.recent_writes() == [game_id]
+        with router.read_session() as db:
+            assert db.get_bind() is replica
+
+        # Once the window has passed, reads go to the (empty) replica and
+        # the write is forgotten.
+        router.lag_seconds = 0
+        assert store.load_game(game_id) is None
+        assert store.list_games() == []
+        assert router.recent_writes() == []
+
+        # Resuming play reads the primary even though the replica lacks it.
+        router.lag_seconds = 60
+        other = play(store, [0])
+        router.lag_seconds = 0
+        state = store.load_game(game_id, for_write=True)
+        assert state.moves == (4, 0)
+        store.save_move(apply_move(state, 8))
+        assert store.load_game(game_id, for_write=True).moves == (4, 0, 8)
+
+        # That write also pruned `other`, which had expired: it stays
+        # forgotten even once the window is widened again.
+        router.lag_seconds = 60
+        assert router.recent_writes() == []
+        with router.read_session(other) as db:
+            assert db.get_bind() is replica
+
+        store.close()
+        primary.dispose()
+        replica.dispose()
+    print("✓ SqlGameStore routing passed")
+
+
+def test_sql_store_without_replicas():
+    """Test that a router without replicas adds no extra reads."""
+    print("\nTesting SqlGameStore without replicas...")
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    router = SessionRouter(engine, lag_seconds=60)
+    store = SqlGameStore(router.write_session(), router)
+    game_id = play(store, [4, 0])
+    assert not store.has_replicas
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    # One page query, with no overlay of recent writes.
+    assert [game.game_id for game in store.list_games()] == [game_id]
+    assert len(statements) == 1
+
+    store.close()
+    engine.dispose()
+    print("✓ SqlGameStore without replicas passed")
+
+
+def test_event_log_store():
+    """Test the event log store, including recovery after reopening."""
+    print("\nTesting EventLogStore...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.log")
+
+        store = EventLogStore(path, batch_size=4)
+        check_store(store)
+        # 9 events so far: only full batches of 4 have been written.
+        assert len(list(read_events(path))) == 8
+        store.flush()
+        assert len(list(read_events(path))) == 9
+        store.close()
+
+        reopened = EventLogStore(path)
+        check_store(reopened)
+        reopened.close()
+    print("✓ EventLogStore passed")
+
+
+def test_event_log_recovery():
+    """Test rebuilding from a snapshot plus the log tail, with a torn write."""
+    print("\nTesting EventLogStore recovery...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.log")
+
+        store = EventLogStore(path, batch_size=1, snapshot_every=5)
+        game_id = play(store, [4, 0, 2, 8])  # snapshot after 5 events
+        state = apply_move(store.load_game(game_id), 6)
+        store.save_move(state)  # tail event after the snapshot
+        store.close()
+        assert os.path.exists(f"{path}.snapshot")
+
+        # Simulate a crash in the middle of appending an event.
+        with open(path, "ab") as f:
+            f.write(EVENT.pack(2, game_id, 1, 0.0)[:5])
+
+        reopened = EventLogStore(path)
+        recovered = reopened.load_game(game_id)
+        assert recovered.moves == (4, 0, 2, 8, 6)
+        assert recovered.winner == Player.X
+        assert (os.path.getsize(path) - HEADER.size) % EVENT.size == 0
+
+        # New games continue after the recovered IDs.
+        assert reopened.new_game().game_id == game_id + 1
+        reopened.close()
+    print("✓ EventLogStore recovery passed")
+
+
+def test_event_log_snapshot_matching():
+    """Test that snapshots are only used with the log they were taken of."""
+    print("\nTesting EventLogStore snapshot matching...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.log")
+        snapshot_path = f"{path}.snapshot"
+
+        store = EventLogStore(path)
+        stale = play(store, [4, 0])
+        store.snapshot()
+        store.close()
+
+        # Deleting the log leaves its snapshot behind; a new log ignores it.
+        os.remove(path)
+        store = EventLogStore(path)
+        assert store.list_games() == []
+        assert not os.path.exists(snapshot_path)
+        fresh = play(store, [8])
+        store.close()
+
+        reopened = EventLogStore(path)
+        assert [game.moves for game in reopened.list_games()] == [(8,)]
+        assert fresh == stale
+        reopened.snapshot()
+        reopened.close()
+
+        # A snapshot claiming to cover more than the log is corrupt.
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        snapshot["offset"] = os.path.getsize(path) + EVENT.size
+        with open(snapshot_path, "w") as f:
+            json.dump(snapshot, f)
+        try:
+            EventLogStore(path)
+        except EventLogError:
+            pass
+        else:
+            raise AssertionError("expected EventLogError")
+    print("✓ EventLogStore snapshot matching passed")
+
+
+def test_event_log_lock():
+    """Test that a log can only be opened by one store at a time."""
+    print("\nTesting EventLogStore locking...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.log")
+        store = EventLogStore(path)
+        try:
+            EventLogStore(path)
+        except EventLogError:
+            pass
+        else:
+            raise AssertionError("expected EventLogError")
+        store.close()
+        EventLogStore(path).close()
+    print("✓ EventLogStore locking passed")
+
+
+if __name__ == "__main__":
+    test_sql_store()
+    test_sql_store_routing()
+    test_sql_store_without_replicas()
+    test_event_log_store()
+    test_event_log_recovery()
+    test_event_log_snapshot_matching()
+    test_event_log_lock()
+    print("\n✓ All tests passed!")
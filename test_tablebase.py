@@ -0,0 +1,115 @@
+"""Test script for the solved-position tablebase."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+from tablebase import HEADER, Tablebase, TablebaseError, board_index, generate, main
+
+
+def test_board_index():
+    """Test the perfect hash of boards."""
+    print("Testing board_index()...")
+    assert board_index("---------") == 0
+    assert board_index("x--------") == 1
+    assert board_index("o--------") == 2
+    assert board_index("-x-------") == 3
+    assert board_index("ooooooooo") == 3**9 - 1
+
+    for bad in ("x", "x---------", "X--------", "--------o--", "x-- -----"):
+        try:
+            board_index(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {bad!r}")
+    print("✓ board_index() passed")
+
+
+def test_generate_and_lookup():
+    """Test generating a tablebase file and looking up positions."""
+    print("\nTesting generate() and Tablebase.lookup()...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tablebase.bin")
+        assert generate(path) == 5478
+
+        with Tablebase(path) as tablebase:
+            # Perfect play from the empty board is a draw that fills the board.
+            entry = tablebase.lookup("---------")
+            assert entry.value == 0
+            assert entry.distance == 9
+            assert len(entry.best_moves) == 9
+
+            # X to move completes the top row.
+            entry = tablebase.lookup("xx-oo----")
+            assert entry.value == 1
+            assert entry.distance == 1
+            assert entry.best_moves == [2]
+
+            # O to move cannot stop both X threats.
+            entry = tablebase.lookup("x-o-o-x-x")
+            assert entry.value == -1
+            assert entry.distance == 2
+
+            # Finished game: the player to move has lost.
+            entry = tablebase.lookup("xxxoo----")
+            assert (entry.value, entry.distance, entry.best) == (-1, 0, 0)
+
+            # Boards that cannot occur in play are not stored.
+            assert tablebase.lookup("xxxxxxxxx") is None
+            assert tablebase.lookup("xxxooo---") is None
+
+            # Malformed boards are rejected, not mapped to another slot.
+            for bad in ("x", "x---------"):
+                try:
+                    tablebase.lookup(bad)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f"expected ValueError for {bad!r}")
+
+        # The CLI reports a malformed board as a usage error.
+        argv, sys.argv = sys.argv, ["tablebase.py", "lookup", path, "X--------"]
+        stderr = io.StringIO()
+        code = None
+        try:
+            with contextlib.redirect_stderr(stderr):
+                main()
+        except SystemExit as e:
+            code = e.code
+        finally:
+            sys.argv = argv
+        assert code == 2
+        assert "invalid board" in stderr.getvalue()
+
+    print("✓ generate() and Tablebase.lookup() passed")
+
+
+def test_rejects_bad_files():
+    """Test that incompatible files are rejected."""
+    print("\nTesting Tablebase() validation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        bad = os.path.join(tmp, "bad.bin")
+        with open(bad, "wb") as f:
+            f.write(b"NOPE" + bytes(HEADER.size))
+        empty = os.path.join(tmp, "empty.bin")
+        open(empty, "wb").close()
+        missing = os.path.join(tmp, "missing.bin")
+
+        for path in (bad, empty, missing):
+            try:
+                Tablebase(path)
+            except TablebaseError:
+                pass
+            else:
+                raise AssertionError(f"expected TablebaseError for {path}")
+    print("✓ Tablebase() validation passed")
+
+
+if __name__ == "__main__":
+    test_board_index()
+    test_generate_and_lookup()
+    test_rejects_bad_files()
+    print("\n✓ All tests passed!")
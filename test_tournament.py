@@ -0,0 +1,96 @@
+"""Test script for strategies and the tournament runner."""
+
+import random
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from db import Base
+from models import Game, GameStatus, Move, Player, TournamentGame
+from strategies import STRATEGIES, greedy_move, solver_move
+from tournament import compute_ratings, play_match, run_tournament, schedule
+
+
+def test_strategies():
+    """Test that strategies play legal, sensible moves."""
+    print("Testing strategies...")
+    rng = random.Random(0)
+    board = "xx-oo----"
+    for strategy in STRATEGIES.values():
+        assert board[strategy(board, Player.O, rng)] == "-"
+
+    # Greedy and solver both take the immediate win.
+    assert greedy_move(board, Player.X, rng) == 2
+    assert solver_move(board, Player.X, rng) == 2
+    # Greedy blocks when it cannot win.
+    assert greedy_move("xx--o----", Player.O, rng) == 2
+    print("✓ strategies passed")
+
+
+def test_schedule():
+    """Test the round-robin schedule alternates who plays X."""
+    print("\nTesting schedule()...")
+    keys = list(schedule(["a", "b", "c"], 2))
+    assert len(keys) == 6
+    assert ("a", "b", 0) in keys
+    assert ("b", "a", 1) in keys
+    assert len(set(keys)) == len(keys)
+    print("✓ schedule() passed")
+
+
+def test_play_match():
+    """Test that matches are finished and reproducible."""
+    print("\nTesting play_match()...")
+    state = play_match("t", "random", "greedy", 3)
+    assert state.status != GameStatus.IN_PROGRESS
+    assert state == play_match("t", "random", "greedy", 3)
+
+    # Perfect play against itself is always a draw.
+    assert play_match("t", "solver", "solver", 0).status == GameStatus.DRAW
+    print("✓ play_match() passed")
+
+
+def test_run_tournament():
+    """Test bulk writes, resuming and ratings."""
+    print("\nTesting run_tournament()...")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        played = run_tournament(
+            db, "t", ["random", "solver"], 20, workers=2, batch_size=7
+        )
+        assert played == 20
+        assert db.scalar(select(func.count()).select_from(Game)) == 20
+        boards = db.scalars(select(Game.board_state)).all()
+        move_count = db.scalar(select(func.count()).select_from(Move))
+        assert move_count == sum(9 - board.count("-") for board in boards)
+
+        # Rerunning with more rounds only plays the missing games.
+        assert run_tournament(db, "t", ["random", "solver"], 30, workers=2) == 10
+        assert run_tournament(db, "t", ["random", "solver"], 30, workers=2) == 0
+
+        # Results-only mode stores no games/moves rows.
+        run_tournament(db, "r", ["random", "greedy"], 4, workers=1, results_only=True)
+        assert db.scalar(select(func.count()).select_from(Game)) == 30
+        stored = db.scalars(
+            select(TournamentGame).where(TournamentGame.tournament == "r")
+        ).all()
+        assert len(stored) == 4
+        assert all(row.game_id is None for row in stored)
+
+        ratings = compute_ratings(db, "t", samples=50)
+        assert [rating.strategy for rating in ratings] == ["solver", "random"]
+        assert all(r.low <= r.elo <= r.high for r in ratings)
+        assert all(rating.games == 30 for rating in ratings)
+
+    engine.dispose()
+    print("✓ run_tournament() passed")
+
+
+if __name__ == "__main__":
+    test_strategies()
+    test_schedule()
+    test_play_match()
+    test_run_tournament()
+    print("\n✓ All tests passed!")
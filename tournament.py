@@ -0,0 +1,410 @@
+"""Round-robin tournaments between computer strategies, with Elo ratings.
+
+Games are played in a process pool and written to the database in bulk.
+Every game has a stable key (x strategy, o strategy, round), so rerunning
+a tournament with the same name only plays the games not stored yet.
+
+    uv run python tournament.py league-1 --games 1000
+    uv run python tournament.py league-1 --games 1000 --results-only
+"""
+
+import argparse
+import itertools
+import os
+import random
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from db import SessionLocal, init_db
+from game_logic import apply_move
+from game_state import GameState
+from models import Game, GameStatus, Move, Player, TournamentGame
+from strategies import STRATEGIES
+
+BATCH_SIZE = 1000
+BASE_ELO = 1500
+BOOTSTRAP_SAMPLES = 200
+
+# (x strategy, o strategy, round)
+MatchKey = tuple[str, str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class Rating:
+    """Elo rating of a strategy with a 95% bootstrap confidence interval."""
+
+    strategy: str
+    elo: float
+    low: float
+    high: float
+    games: int
+
+
+def schedule(strategies: list[str], games_per_pair: int) -> Iterator[MatchKey]:
+    """
+    Generate the round-robin schedule.
+
+    Every pair of strategies meets `games_per_pair` times, alternating
+    which of them plays X.
+
+    Args:
+        strategies: Strategy names
+        games_per_pair: Number of games between each pair
+
+    Yields:
+        Match keys
+    """
+    for first, second in itertools.combinations(strategies, 2):
+        for round_number in range(games_per_pair):
+            if round_number % 2 == 0:
+                yield first, second, round_number
+            else:
+                yield second, first, round_number
+
+
+def play_match(
+    tournament: str, x_strategy: str, o_strategy: str, round_number: int
+) -> GameState:
+    """
+    Play one tournament game.
+
+    The game is seeded from its key, so replaying a key gives the same game.
+
+    Args:
+        tournament: Tournament name
+        x_strategy: Strategy playing X
+        o_strategy: Strategy playing O
+        round_number: Round of this pairing
+
+    Returns:
+        Final GameState
+    """
+    seed = zlib.crc32(f"{tournament}/{x_strategy}/{o_strategy}/{round_number}".encode())
+    rng = random.Random(seed)
+    players = {Player.X: STRATEGIES[x_strategy], Player.O: STRATEGIES[o_strategy]}
+
+    state = GameState()
+    while state.status == GameStatus.IN_PROGRESS:
+        strategy = players[state.current_player]
+        state = apply_move(state, strategy(state.board, state.current_player, rng))
+    return state
+
+
+def stored_keys(db: Session, tournament: str) -> set[MatchKey]:
+    """
+    Get the keys of games already stored for a tournament.
+
+    Args:
+        db: Database session
+        tournament: Tournament name
+
+    Returns:
+        Set of match keys
+    """
+    rows = db.execute(
+        select(
+            TournamentGame.x_strategy,
+            TournamentGame.o_strategy,
+            TournamentGame.round,
+        ).where(TournamentGame.tournament == tournament)
+    )
+    return {tuple(row) for row in rows}
+
+
+def save_results(
+    db: Session,
+    tournament: str,
+    results: list[tuple[MatchKey, GameState]],
+    results_only: bool = False,
+) -> None:
+    """
+    Write a batch of finished games with bulk inserts and one commit.
+
+    Args:
+        db: Database session
+        tournament: Tournament name
+        results: Match keys with their final states
+        results_only: Skip the games/moves rows and store results only
+    """
+    game_ids: list[int | None] = [None] * len(results)
+    if not results_only:
+        game_ids = db.scalars(
+            insert(Game).returning(Game.id, sort_by_parameter_order=True),
+            [
+                {
+                    "board_state": state.board,
+                    "current_player": state.current_player,
+                    "status": state.status,
+                    "winner": state.winner,
+                }
+                for _, state in results
+            ],
+        ).all()
+        db.execute(
+            insert(Move),
+            [
+                {
+                    "game_id": game_id,
+                    "player": Player(state.board[position]),
+                    "position": position,
+                    "move_number": number,
+                }
+                for game_id, (_, state) in zip(game_ids, results, strict=True)
+                for number, position in enumerate(state.moves, start=1)
+            ],
+        )
+
+    db.execute(
+        insert(TournamentGame),
+        [
+            {
+                "tournament": tournament,
+                "x_strategy": x_strategy,
+                "o_strategy": o_strategy,
+                "round": round_number,
+                "status": state.status,
+                "winner": state.winner,
+                "game_id": game_id,
+            }
+            for game_id, ((x_strategy, o_strategy, round_number), state) in zip(
+                game_ids, results, strict=True
+            )
+        ],
+    )
+    db.commit()
+
+
+def _submit(
+    pool: ProcessPoolExecutor,
+    tournament: str,
+    batch: tuple[MatchKey, ...],
+    chunksize: int,
+) -> Iterator[GameState]:
+    """Start playing a batch of games; returns their states in batch order."""
+    x_strategies, o_strategies, rounds = zip(*batch, strict=True)
+    return pool.map(
+        play_match,
+        itertools.repeat(tournament),
+        x_strategies,
+        o_strategies,
+        rounds,
+        chunksize=chunksize,
+    )
+
+
+def _save_batch(
+    db: Session,
+    tournament: str,
+    keys: tuple[MatchKey, ...],
+    states: Iterator[GameState],
+    results_only: bool,
+) -> int:
+    """Wait for a submitted batch, write it and return its size."""
+    save_results(db, tournament, list(zip(keys, states, strict=True)), results_only)
+    return len(keys)
+
+
+def run_tournament(
+    db: Session,
+    tournament: str,
+    strategies: list[str],
+    games_per_pair: int,
+    workers: int | None = None,
+    results_only: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Play every game of the schedule that is not stored yet.
+
+    Games are played in a process pool (they need no database access);
+    the calling process writes the results in batches of `batch_size`.
+    The schedule is consumed one batch at a time, with the next batch
+    playing while the previous one is written, so memory stays bounded
+    by two batches however large the tournament is.
+
+    Args:
+        db: Database session
+        tournament: Tournament name
+        strategies: Strategy names
+        games_per_pair: Number of games between each pair
+        workers: Number of worker processes (default: CPU count)
+        results_only: Skip the games/moves rows and store results only
+        batch_size: Number of games per bulk write
+
+    Returns:
+        Number of games played
+    """
+    done = stored_keys(db, tournament)
+    pending = (key for key in schedule(strategies, games_per_pair) if key not in done)
+    batches = itertools.batched(pending, batch_size, strict=False)
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, batch_size // (workers * 4))
+    played = 0
+
+    with ProcessPoolExecutor(workers) as pool:
+        in_flight = None
+        for batch in batches:
+            # Start the next batch playing before writing the previous one.
+            started = batch, _submit(pool, tournament, batch, chunksize)
+            if in_flight is not None:
+                played += _save_batch(db, tournament, *in_flight, results_only)
+            in_flight = started
+        if in_flight is not None:
+            played += _save_batch(db, tournament, *in_flight, results_only)
+
+    return played
+
+
+def _fit_elo(counts: np.ndarray, iterations: int = 200) -> np.ndarray:
+    """
+    Fit Elo ratings to result counts (Bradley-Terry, draws as half wins).
+
+    Args:
+        counts: (k, k, 3) games by X index, O index and X score
+            (0 = loss, 1 = draw, 2 = win)
+        iterations: Number of minorization-maximization steps
+
+    Returns:
+        (k,) ratings centred on BASE_ELO
+    """
+    k = counts.shape[0]
+    games = counts.sum(axis=2)
+    scores = counts[:, :, 1] * 0.5 + counts[:, :, 2]
+
+    # One virtual draw between every pair keeps winless strategies finite.
+    prior = np.ones((k, k)) - np.eye(k)
+    played = games + games.T + prior
+    wins = scores.sum(axis=1) + (games - scores).sum(axis=0) + prior.sum(axis=1) / 2
+
+    strength = np.ones(k)
+    for _ in range(iterations):
+        strength = wins / (played / (strength[:, None] + strength[None, :])).sum(axis=1)
+        strength /= np.exp(np.log(strength).mean())
+    return BASE_ELO + 400 * np.log10(strength)
+
+
+def compute_ratings(
+    db: Session, tournament: str, samples: int = BOOTSTRAP_SAMPLES
+) -> list[Rating]:
+    """
+    Compute Elo ratings for a tournament from its stored results.
+
+    The confidence interval is the 2.5-97.5 percentile range of ratings
+    refitted on bootstrap resamples of the games.
+
+    Args:
+        db: Database session
+        tournament: Tournament name
+        samples: Number of bootstrap resamples
+
+    Returns:
+        Ratings sorted from best to worst
+    """
+    rows = db.execute(
+        select(
+            TournamentGame.x_strategy,
+            TournamentGame.o_strategy,
+            TournamentGame.status,
+            TournamentGame.winner,
+            func.count(),
+        )
+        .where(TournamentGame.tournament == tournament)
+        .group_by(
+            TournamentGame.x_strategy,
+            TournamentGame.o_strategy,
+            TournamentGame.status,
+            TournamentGame.winner,
+        )
+    ).all()
+    if not rows:
+        return []
+
+    names = sorted({row[0] for row in rows} | {row[1] for row in rows})
+    index = {name: i for i, name in enumerate(names)}
+    counts = np.zeros((len(names), len(names), 3), dtype=np.int64)
+    for x_strategy, o_strategy, status, winner, count in rows:
+        if status == GameStatus.DRAW:
+            outcome = 1
+        else:
+            outcome = 2 if winner == Player.X else 0
+        counts[index[x_strategy], index[o_strategy], outcome] += count
+
+    elo = _fit_elo(counts)
+
+    rng = np.random.default_rng(0)
+    total = int(counts.sum())
+    resamples = np.array(
+        [
+            _fit_elo(
+                rng.multinomial(total, counts.ravel() / total).reshape(counts.shape)
+            )
+            for _ in range(samples)
+        ]
+    )
+    low, high = np.percentile(resamples, [2.5, 97.5], axis=0)
+
+    games = counts.sum(axis=(1, 2)) + counts.sum(axis=(0, 2))
+    ratings = [
+        Rating(name, float(elo[i]), float(low[i]), float(high[i]), int(games[i]))
+        for i, name in enumerate(names)
+    ]
+    return sorted(ratings, key=lambda rating: rating.elo, reverse=True)
+
+
+def display_ratings(ratings: list[Rating]) -> None:
+    """
+    Display a ratings table.
+
+    Args:
+        ratings: Ratings sorted from best to worst
+    """
+    print(f"\n{'Strategy':<10}{'Elo':>8}{'95% CI':>18}{'Games':>10}")
+    print("-" * 46)
+    for rating in ratings:
+        interval = f"[{rating.low:.0f}, {rating.high:.0f}]"
+        print(
+            f"{rating.strategy:<10}{rating.elo:>8.0f}{interval:>18}{rating.games:>10}"
+        )
+
+
+def main() -> None:
+    """Run (or resume) the tournament given on the command line and show ratings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tournament", help="tournament name (reuse it to resume)")
+    parser.add_argument(
+        "--strategies", nargs="+", choices=sorted(STRATEGIES), default=list(STRATEGIES)
+    )
+    parser.add_argument("--games", type=int, default=100, help="games per pair")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "--results-only",
+        action="store_true",
+        help="store results without the games/moves rows",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    with SessionLocal() as db:
+        played = run_tournament(
+            db,
+            args.tournament,
+            args.strategies,
+            args.games,
+            workers=args.workers,
+            results_only=args.results_only,
+            batch_size=args.batch_size,
+        )
+        print(f"Played {played} games in tournament '{args.tournament}'")
+        display_ratings(compute_ratings(db, args.tournament))
+
+
+if __name__ == "__main__":
+    main()